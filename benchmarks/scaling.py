@@ -0,0 +1,78 @@
+"""This file is for benchmarking how the genetic algorithm scales
+
+Runs the generation loop over growing population sizes and numbers of
+generations and prints the wall time, the time per individual and
+generation, and the peak traced memory of every run.
+
+Usage (from the repository root):
+    python -m benchmarks.scaling
+    python -m benchmarks.scaling --engine list --pop-sizes 1000 10000
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.vectorized_genetic_algorithm import VectorizedGeneticAlgorithm
+
+ENGINES = {
+    'list': GeneticAlgorithm,
+    'numpy': VectorizedGeneticAlgorithm,
+}
+
+def run(engine: str, pop_size: int, num_generations: int, chromo_len: int) -> dict:
+    """Runs one execution and returns its measurements"""
+    ga = ENGINES[engine]()
+    ga.pop_size = pop_size
+    ga.num_generations = num_generations
+    ga.chromo_len = chromo_len
+    ga.history = 'summary'
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ga.execute()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'pop_size': pop_size,
+        'generations': num_generations,
+        'seconds': seconds,
+        'ns_per_individual': seconds / (pop_size * num_generations) * 1e9,
+        'peak_mb': peak / 2**20,
+    }
+
+def print_row(row: dict) -> None:
+    """Prints one measurement"""
+    print(
+        f"{row['pop_size']:>10} {row['generations']:>11} {row['seconds']:>10.3f}"
+        f" {row['ns_per_individual']:>18.1f} {row['peak_mb']:>10.1f}"
+    )
+
+def main():
+    """Main function to run the scaling benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--engine', choices=ENGINES, default='numpy')
+    parser.add_argument('--chromo-len', type=int, default=3)
+    parser.add_argument('--pop-sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--generations', type=int, nargs='+',
+                        default=[10, 100, 1_000])
+    parser.add_argument('--base-pop-size', type=int, default=10_000,
+                        help='population size used while growing the generations')
+    parser.add_argument('--base-generations', type=int, default=10,
+                        help='number of generations used while growing the population')
+    args = parser.parse_args()
+
+    print(f"{'pop_size':>10} {'generations':>11} {'seconds':>10}"
+          f" {'ns/individual/gen':>18} {'peak_mb':>10}")
+
+    for pop_size in args.pop_sizes:
+        print_row(run(args.engine, pop_size, args.base_generations, args.chromo_len))
+
+    for num_generations in args.generations:
+        print_row(run(args.engine, args.base_pop_size, num_generations, args.chromo_len))
+
+if __name__ == '__main__':
+    main()
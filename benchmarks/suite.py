@@ -0,0 +1,257 @@
+"""This file is for benchmarking every operator and the whole generation loop
+
+Times the creation of every gen type, every selection, crossover and
+mutation (list and batch paths), the triangle classification and a full
+execute() of every engine over a grid of population sizes and chromosome lengths. Every
+benchmark is run for some rounds and its median time is kept.
+
+The results can be saved as a JSON baseline; later runs are compared
+with it and the command fails when a benchmark got slower than the
+threshold allows.
+
+Usage (from the repository root):
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite
+    python -m benchmarks.suite --filter selection --threshold 0.5
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.models.evaluation import TriangleClassification
+from src.models.ga.crossover import OnePoint, Order, TwoPoint, Uniform
+from src.models.ga.gen import Binary, Integer, Permutation, RealNumber
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.mutation import Gaussian, RandomResetting, Swap
+from src.models.ga.selection import (
+    RandomSelection,
+    Roulette,
+    SteadyState,
+    StochasticUniversalSampling,
+    Tournament,
+)
+from src.models.ga.steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+from src.models.ga.vectorized_genetic_algorithm import VectorizedGeneticAlgorithm
+
+BASELINE = Path(__file__).with_name('baseline.json')
+
+GENS = [RealNumber, Integer, Binary, Permutation]
+SELECTIONS = [RandomSelection, SteadyState, Tournament, Roulette, StochasticUniversalSampling]
+CROSSOVERS = [OnePoint, TwoPoint, Uniform]
+MUTATIONS = [RandomResetting, Gaussian, Swap]
+ENGINES = {
+    'list': GeneticAlgorithm,
+    'numpy': VectorizedGeneticAlgorithm,
+    'steady-state': SteadyStateGeneticAlgorithm,
+}
+
+def measure(function, min_time: float, max_rounds: int) -> dict:
+    """Calls the function until min_time has passed or max_rounds are done"""
+    function()  # Warm up
+    times = []
+    start = time.perf_counter()
+
+    while len(times) < max_rounds and (len(times) < 3 or time.perf_counter() - start < min_time):
+        round_start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - round_start)
+
+    return {
+        'rounds': len(times),
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+    }
+
+def benchmarks(pop_size: int, chromo_len: int, generations: int):
+    """Yields (name, function) of every benchmark for one size of the grid"""
+    rng = np.random.default_rng(0)
+    gen = RealNumber()
+    gen.rng = rng
+    matrix = gen.create_batch((pop_size, chromo_len))
+    fitness = rng.random(pop_size)
+    chromosomes = matrix.tolist()
+    evaluated_pop = [[chromo, score] for chromo, score in zip(chromosomes, fitness.tolist())]
+    num_pairs = -(-pop_size // 2)
+    pairs1 = rng.integers(0, pop_size, size=num_pairs)
+    pairs2 = rng.integers(0, pop_size, size=num_pairs)
+    out = np.empty_like(matrix)
+    size = f'pop_size={pop_size},chromo_len={chromo_len}'
+
+    for gen_class in GENS:
+        gen_type = gen_class()
+        gen_type.rng = np.random.default_rng(0)
+
+        def create(g=gen_type):
+            for _ in range(pop_size):
+                g.create_chromosome(chromo_len)
+
+        yield f'gen/{gen_type.type}/create_chromosome[{size}]', create
+        yield (f'gen/{gen_type.type}/create_batch[{size}]',
+               lambda g=gen_type: g.create_batch(matrix.shape))
+
+    for selection_class in SELECTIONS:
+        selection = selection_class(0.5)
+        selection.rng = np.random.default_rng(0)
+        name = f'selection/{selection.type}'
+        yield f'{name}/select[{size}]', lambda s=selection: s.select(evaluated_pop, pop_size)
+        yield f'{name}/select_batch[{size}]', lambda s=selection: s.select_batch(fitness, pop_size)
+
+    for crossover_class in CROSSOVERS:
+        crossover = crossover_class()
+        crossover.rng = np.random.default_rng(0)
+        name = f'crossover/{crossover.type}'
+
+        def cross(c=crossover):
+            for parent1, parent2 in zip(pairs1.tolist(), pairs2.tolist()):
+                c.cross(chromo_len, chromosomes[parent1], chromosomes[parent2])
+
+        yield f'{name}/cross[{size}]', cross
+        yield (f'{name}/cross_batch[{size}]',
+               lambda c=crossover: c.cross_batch(matrix, pairs1, pairs2, out=out))
+
+    # Order crossover only crosses permutations
+    permutation = Permutation()
+    permutation.rng = np.random.default_rng(0)
+    permutation_matrix = permutation.create_batch(matrix.shape)
+    permutations = permutation_matrix.tolist()
+    permutation_out = np.empty_like(permutation_matrix)
+    order = Order()
+    order.rng = np.random.default_rng(0)
+
+    def cross_order():
+        for parent1, parent2 in zip(pairs1.tolist(), pairs2.tolist()):
+            order.cross(chromo_len, permutations[parent1], permutations[parent2])
+
+    yield f'crossover/order/cross[{size}]', cross_order
+    yield (f'crossover/order/cross_batch[{size}]',
+           lambda: order.cross_batch(permutation_matrix, pairs1, pairs2, out=permutation_out))
+
+    for mutation_class in MUTATIONS:
+        mutation = mutation_class(0.3)
+        mutation.rng = np.random.default_rng(0)
+        mutation.gen = gen
+        name = f'mutation/{mutation.type}'
+        offspring = [list(chromo) for chromo in chromosomes]
+        offspring_matrix = matrix.copy()
+        yield (f'{name}/mutate[{size}]',
+               lambda m=mutation, o=offspring: m.mutate(o, chromo_len, gen.create))
+        yield (f'{name}/mutate_batch[{size}]',
+               lambda m=mutation, o=offspring_matrix: m.mutate_batch(o, gen))
+
+    evaluation = TriangleClassification()
+
+    def score():
+        for chromo in chromosomes:
+            evaluation.score(chromo, 'scalene')
+
+    yield f'evaluation/triangle-classification/score[{size}]', score
+    yield (f'evaluation/triangle-classification/score_batch[{size}]',
+           lambda: evaluation.score_batch(matrix, 'scalene'))
+
+    for engine, ga_class in ENGINES.items():
+        def execute(ga_class=ga_class):
+            ga = ga_class()
+            ga.seed = 0
+            ga.pop_size = pop_size
+            ga.chromo_len = chromo_len
+            ga.num_generations = generations
+            ga.history = 'summary'
+            ga.execute()
+
+        yield f'execute/{engine}[{size},generations={generations}]', execute
+
+def run(args) -> dict:
+    """Runs every benchmark of the grid matching the filter"""
+    results = {}
+
+    for pop_size in args.pop_sizes:
+        for chromo_len in args.chromo_lens:
+            for name, function in benchmarks(pop_size, chromo_len, args.generations):
+                if args.filter and args.filter not in name:
+                    continue
+
+                results[name] = measure(function, args.min_time, args.max_rounds)
+                print(f"{name:<80} {results[name]['median'] * 1e3:>12.3f} ms")
+
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Returns the names of the benchmarks slower than the baseline allows"""
+    regressions = []
+
+    print(f"\n{'benchmark':<80} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        base = baseline[name]['median']
+        change = result['median'] / base - 1
+        regressed = change > threshold
+
+        if regressed:
+            regressions.append(name)
+
+        print(f"{name:<80} {base * 1e3:>12.3f} {result['median'] * 1e3:>12.3f}"
+              f" {change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+
+    return regressions
+
+def main():
+    """Main function to run the benchmark suite"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pop-sizes', type=int, nargs='+', default=[100, 1_000, 10_000])
+    parser.add_argument('--chromo-lens', type=int, nargs='+', default=[3, 30])
+    parser.add_argument('--generations', type=int, default=10,
+                        help='number of generations of the execute benchmarks')
+    parser.add_argument('--filter', default='', help='only run benchmarks containing this text')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='seconds every benchmark is run for at least')
+    parser.add_argument('--max-rounds', type=int, default=100)
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save', action='store_true',
+                        help='save the results as the baseline instead of comparing with it')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown over the baseline, 0.2 means 20%%')
+    args = parser.parse_args()
+
+    results = run(args)
+
+    if args.save:
+        # Results of benchmarks that were not run are kept
+        baseline = {}
+
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding='utf-8'))["results"]
+
+        baseline.update(results)
+        document = {
+            "machine": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "results": baseline,
+        }
+        args.baseline.write_text(json.dumps(document, indent=2), encoding='utf-8')
+        print(f'\nBaseline saved to {args.baseline}')
+        return
+
+    if not args.baseline.exists():
+        print(f'\nNo baseline at {args.baseline}, run with --save to create it')
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))["results"]
+    regressions = compare(results, baseline, args.threshold)
+
+    if regressions:
+        print(f'\n{len(regressions)} benchmarks regressed more than {args.threshold:.0%}')
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+"""This file is for running the command line interface with python -m src"""
+import sys
+
+from src.cli import main
+
+main(sys.argv[1:])
@@ -0,0 +1,270 @@
+"""This file is for defining the command line interface
+
+Usage (from the repository root):
+    python -m src run --pop-size 1000 --crossover two-point --workers 8 --output run.npz
+    python -m src run --engine numpy --seed 1 --stop target-fitness 1 --format json
+    python -m src sweep --grid selection_type=random,tournament --grid mutation_rate=0.1,0.3
+
+Only argparse is imported at start up: the genetic algorithm is imported
+when a run starts, and pandas only for the table output.
+"""
+import argparse
+import json
+import sys
+import time
+
+ENGINES = ['list', 'numpy', 'steady-state']
+FORMATS = ['summary', 'json', 'table']
+# Arguments restored from the checkpoint by --resume, so they cannot be given with it
+RESUMED_ARGUMENTS = [
+    'evaluation', 'expected_solution', 'gen', 'chromo_len', 'pop_size', 'selection',
+    'selection_rate', 'crossover', 'mutation', 'mutation_rate', 'elitism',
+    'duplicate_elimination', 'batch_size', 'seed', 'stop',
+]
+
+def number(text: str):
+    """Parses an int, or a float if it is not one"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def value(text: str):
+    """Parses a number, or keeps the text if it is not one"""
+    try:
+        return number(text)
+    except ValueError:
+        return text
+
+def grid_entry(text: str) -> tuple:
+    """Parses ATTRIBUTE=VALUE,VALUE,... into (attribute, values)"""
+    attribute, separator, values = text.partition('=')
+
+    if not separator or not attribute or not values:
+        raise argparse.ArgumentTypeError('grid entries must be ATTRIBUTE=VALUE,VALUE,...')
+
+    return attribute, [value(text) for text in values.split(',')]
+
+def add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the arguments configuring a genetic algorithm"""
+    parser.add_argument('--engine', choices=ENGINES, default='list',
+                        help='list: GeneticAlgorithm, numpy: VectorizedGeneticAlgorithm, '
+                             'steady-state: SteadyStateGeneticAlgorithm')
+    parser.add_argument('--evaluation')
+    parser.add_argument('--expected-solution')
+    parser.add_argument('--gen', help='gen type')
+    parser.add_argument('--chromo-len', type=int)
+    parser.add_argument('--pop-size', type=int)
+    parser.add_argument('--generations', type=int)
+    parser.add_argument('--selection', help='selection type')
+    parser.add_argument('--selection-rate', type=float)
+    parser.add_argument('--crossover', help='crossover type')
+    parser.add_argument('--mutation', help='mutation type')
+    parser.add_argument('--mutation-rate', type=float)
+    parser.add_argument('--elitism', type=int, help='fittest individuals kept every generation')
+    parser.add_argument('--duplicate-elimination', action='store_true')
+    parser.add_argument('--batch-size', type=int,
+                        help='children bred and evaluated together by the steady-state engine')
+    parser.add_argument('--executor', help='evaluation executor type')
+    parser.add_argument('--workers', type=int, help='implies --executor process if none is given')
+    parser.add_argument('--chunk-size', type=int)
+    parser.add_argument('--fitness-cache', action='store_true')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--stop', nargs=2, action='append', default=[],
+                        metavar=('TYPE', 'VALUE'), help='stopping criterion, may be repeated')
+
+def configure(args: argparse.Namespace):
+    """Creates the genetic algorithm configured by the arguments"""
+    # pylint: disable=import-outside-toplevel
+    if args.engine == 'numpy':
+        from src.models.ga.vectorized_genetic_algorithm import VectorizedGeneticAlgorithm
+        ga = VectorizedGeneticAlgorithm()
+    elif args.engine == 'steady-state':
+        from src.models.ga.steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+        ga = SteadyStateGeneticAlgorithm()
+    else:
+        from src.models.ga.genetic_algorithm import GeneticAlgorithm
+        ga = GeneticAlgorithm()
+
+    # Workers only make sense with an executor that has them
+    executor = args.executor
+
+    if executor is None and args.workers is not None:
+        executor = 'process'
+
+    # Types go first so the attributes below end up on the new objects
+    attributes = [
+        ('evaluation', args.evaluation),
+        ('expected_solution', args.expected_solution),
+        ('gen_type', args.gen),
+        ('selection_type', args.selection),
+        ('crossover_type', args.crossover),
+        ('mutation_type', args.mutation),
+        ('executor_type', executor),
+        ('chromo_len', args.chromo_len),
+        ('pop_size', args.pop_size),
+        ('num_generations', args.generations),
+        ('selection_rate', args.selection_rate),
+        ('mutation_rate', args.mutation_rate),
+        ('elitism', args.elitism),
+        ('workers', args.workers),
+        ('chunk_size', args.chunk_size),
+        ('seed', args.seed),
+    ]
+
+    for attribute, value in attributes:
+        if value is not None:
+            setattr(ga, attribute, value)
+
+    if args.batch_size is not None:
+        if args.engine != 'steady-state':
+            raise ValueError('Batch size needs the steady-state engine')
+
+        ga.batch_size = args.batch_size
+
+    ga.fitness_cache = args.fitness_cache
+    ga.duplicate_elimination = args.duplicate_elimination
+
+    for criterion_type, value in args.stop:
+        ga.add_stopping_criterion(criterion_type, number(value))
+
+    return ga
+
+def run(args: argparse.Namespace) -> None:
+    """Runs a genetic algorithm and prints its results"""
+    if args.resume is not None:
+        restored = [
+            '--' + name.replace('_', '-') for name in RESUMED_ARGUMENTS
+            if getattr(args, name) not in (None, False, [])
+        ]
+
+        if restored:
+            raise ValueError('The checkpoint of --resume sets', ', '.join(restored))
+
+    ga = configure(args)
+
+    if args.resume is not None:
+        generations = ga.num_generations if args.generations is not None else None
+        ga.resume_from(args.resume)
+
+        if generations is not None:
+            ga.num_generations = generations
+
+    # The summary and json outputs only need the final population
+    if args.history is not None:
+        ga.history = args.history
+    elif args.format != 'table':
+        ga.history = 'none'
+
+    ga.history_path = args.history_path
+    ga.checkpoint_path = args.checkpoint
+    ga.checkpoint_interval = args.checkpoint_interval
+    ga.profiling = args.profile
+
+    start = time.perf_counter()
+    config, exec_data = ga.execute()
+    seconds = time.perf_counter() - start
+
+    if args.output is not None:
+        ga.checkpoint(args.output)
+
+    if args.format == 'table':
+        from pandas import DataFrame  # pylint: disable=import-outside-toplevel
+        print(DataFrame(config).to_string())
+        print(DataFrame(exec_data).to_string())
+        return
+
+    summary = ga.summarize(ga.current_pop)
+    result = {
+        "Algorithm": ga.name,
+        "Generations run": config["Generations run"][0],
+        "Stop reason": ga.stop_reason,
+        "Evaluations": ga.num_evaluations,
+        "Best fitness": summary["Best fitness"],
+        "Mean fitness": summary["Mean fitness"],
+        "Best chromosome": summary["Best chromosome"],
+        "Seconds": seconds,
+    }
+
+    if ga.metrics is not None:
+        result.update(ga.metrics)
+
+    if args.format == 'json':
+        config = {name: values[0] for name, values in config.items()}
+        print(json.dumps({"result": result, "config": config}, default=str))
+    else:
+        for name, value in result.items():
+            print(f'{name}: {value}')
+
+def sweep(args: argparse.Namespace) -> None:
+    """Runs a parameter sweep and prints its results"""
+    from src.models.ga.sweep import Sweep  # pylint: disable=import-outside-toplevel
+
+    if not args.grid:
+        raise ValueError('A sweep needs at least one --grid entry')
+
+    sweep_runner = Sweep(configure(args), dict(args.grid))
+    sweep_runner.replicates = args.replicates
+    sweep_runner.seed = args.seed
+
+    if args.processes is not None:
+        sweep_runner.workers = args.processes
+
+    table = sweep_runner.execute(output=args.output)
+    aggregated = sweep_runner.aggregate(table)
+
+    if args.format == 'table':
+        from pandas import DataFrame  # pylint: disable=import-outside-toplevel
+        print(DataFrame(table).to_string())
+        print(DataFrame(aggregated).to_string())
+    elif args.format == 'json':
+        print(json.dumps({"runs": table, "aggregate": aggregated}, default=str))
+    else:
+        columns = list(aggregated)
+
+        for i in range(len(aggregated[columns[0]])):
+            print(', '.join(f'{column}: {aggregated[column][i]}' for column in columns))
+
+def main(argv: list = None) -> None:
+    """Main function of the command line interface"""
+    parser = argparse.ArgumentParser(prog='python -m src', description='Genetic algorithm')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run a genetic algorithm')
+    add_run_arguments(run_parser)
+    run_parser.add_argument('--format', choices=FORMATS, default='summary',
+                            help='table needs pandas')
+    run_parser.add_argument('--history', help='history retention policy of the table output')
+    run_parser.add_argument('--history-path', help='directory to write the run history to')
+    run_parser.add_argument('--checkpoint', help='checkpoint file written during the run')
+    run_parser.add_argument('--checkpoint-interval', type=int, default=10)
+    run_parser.add_argument('--resume',
+                            help='checkpoint file to resume the run from, it sets every '
+                                 'argument but --generations, --executor, --workers, '
+                                 '--chunk-size and --fitness-cache')
+    run_parser.add_argument('--output', help='.npz file the final state is saved to')
+    run_parser.add_argument('--profile', action='store_true')
+    run_parser.set_defaults(handler=run)
+
+    sweep_parser = commands.add_parser('sweep', help='run a parameter grid on a process pool')
+    add_run_arguments(sweep_parser)
+    sweep_parser.add_argument('--grid', type=grid_entry, action='append', default=[],
+                              metavar='ATTRIBUTE=VALUE,...',
+                              help='attribute and values to try, may be repeated')
+    sweep_parser.add_argument('--replicates', type=int, default=1)
+    sweep_parser.add_argument('--processes', type=int,
+                              help='size of the process pool, the number of CPUs by default')
+    sweep_parser.add_argument('--format', choices=FORMATS, default='summary',
+                              help='table needs pandas')
+    sweep_parser.add_argument('--output', help='CSV file the summary row of every run is written to')
+    sweep_parser.set_defaults(handler=sweep)
+
+    args = parser.parse_args(argv)
+
+    try:
+        args.handler(args)
+    except ValueError as error:
+        parser.exit(2, f'{parser.prog}: error: {" ".join(map(str, error.args))}\n')
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,9 +1,11 @@
 """This file is for executing the GA and printing its results"""
-from pandas import DataFrame
 from src.models.ga.genetic_algorithm import GeneticAlgorithm
 
 def main():
     """Main function to execute the GA"""
+    # pandas is only needed to print, so it does not slow down importing this file
+    from pandas import DataFrame  # pylint: disable=import-outside-toplevel
+
     ga = GeneticAlgorithm()
     ga.init_pop()
     conf, exec_data = ga.execute()
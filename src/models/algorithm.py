@@ -1,7 +1,7 @@
 """This file is for defining the algorithm class.
 
 The algorithm class is the base class for all algorithms."""
-from src.models.evaluation import TriangleClassification
+from src.models.evaluation import Sphere, TriangleClassification
 
 class Algorithm:
     """Algorithm base class"""
@@ -9,6 +9,7 @@ class Algorithm:
         self._name = 'Algorithm'
         self._evaluations = [
             ['triangle-classification', TriangleClassification],
+            ['sphere', Sphere],
         ]
         self._evaluation = TriangleClassification()
         self._expected_solution = 'scalene'
@@ -25,10 +26,17 @@ class Algorithm:
 
     @evaluation.setter
     def evaluation(self, evaluation) -> None:
-        """Set evaluation"""
+        """Set evaluation
+
+        The expected solution is reset to the first one of the evaluation
+        when the current one is not valid for it
+        """
         for name, eval_class in self._evaluations:
             if name == evaluation:
                 self._evaluation = eval_class()
+
+                if self._expected_solution not in self._evaluation.expected_solutions:
+                    self._expected_solution = self._evaluation.expected_solutions[0]
                 return
 
         raise ValueError('Evaluation must be a valid value: ', self._evaluations)
@@ -1,10 +1,19 @@
 """This file is for defining the evaluations."""
+import asyncio
+
+import numpy as np
 
 class Evaluation:
-    """Evaluation class"""
-    def __init__(self) -> None:
+    """Evaluation class
+
+    Evaluations whose score of the same data can change, e.g. noisy
+    simulations, are created with deterministic=False so their scores are
+    never cached
+    """
+    def __init__(self, deterministic: bool = True) -> None:
         self._name = 'Evaluation'
         self._expected_solutions = []
+        self._deterministic = deterministic
 
     @property
     def name(self) -> str:
@@ -16,10 +25,93 @@ class Evaluation:
         """Get expected solutions"""
         return self._expected_solutions
 
+    @property
+    def deterministic(self) -> bool:
+        """Whether the same data always gets the same score, so it can be cached"""
+        return self._deterministic
+
+    @deterministic.setter
+    def deterministic(self, deterministic: bool) -> None:
+        """Set whether the same data always gets the same score"""
+        self._deterministic = deterministic
+
     def score(self, data: list, expected_solution: str) -> list:
         """Evaluation method"""
         raise NotImplementedError('Evaluation method should be implemented by child class')
 
+    @property
+    def asynchronous(self) -> bool:
+        """Whether the child class implements its own ascore()"""
+        return type(self).ascore is not Evaluation.ascore
+
+    async def ascore(self, data: list, expected_solution: str) -> list:
+        """Asynchronous evaluation method
+
+        Evaluations that wait on I/O (e.g. a remote simulator or service)
+        implement it so many chromosomes are scored concurrently. Falls
+        back to running score() in a thread
+        """
+        return await asyncio.to_thread(self.score, data, expected_solution)
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether the child class implements its own score_batch()"""
+        return type(self).score_batch is not Evaluation.score_batch
+
+    def score_batch(self, matrix, expected_solution: str) -> np.ndarray:
+        """Batch evaluation method
+
+        Scores every row of the matrix and returns the fitness array.
+        Falls back to calling score() once per row
+        """
+        return np.fromiter(
+            (self.score(data, expected_solution)[1] for data in matrix),
+            dtype=np.float64,
+            count=len(matrix)
+        )
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the child class implements its own score_delta()"""
+        return type(self).score_delta is not Evaluation.score_delta
+
+    def score_delta(self, data: list, score: float, indexes: list, old_gens: list,
+                    expected_solution: str) -> float:
+        """Incremental evaluation method
+
+        Returns the score of data knowing the score of a chromosome that
+        only differs from it at indexes, where it had old_gens. Only
+        evaluations whose score can be updated gen by gen implement it
+        """
+        raise NotImplementedError('Incremental evaluation should be implemented by child class')
+
+    def score_delta_batch(self, matrix, scores: np.ndarray, rows: np.ndarray,
+                          columns: np.ndarray, old_gens: np.ndarray,
+                          expected_solution: str) -> np.ndarray:
+        """Batch incremental evaluation method
+
+        Row i of the matrix differs from a chromosome scored scores[i] at
+        the (rows, columns) pairs where rows == i, where it had old_gens.
+        The pairs are sorted by row. Falls back to calling score_delta()
+        once per row
+        """
+        bounds = np.searchsorted(rows, np.arange(len(matrix) + 1))
+
+        return np.fromiter(
+            (
+                self.score_delta(
+                    list(data),
+                    score,
+                    columns[start:end].tolist(),
+                    old_gens[start:end].tolist(),
+                    expected_solution
+                )
+                for data, score, start, end in zip(matrix, scores, bounds[:-1], bounds[1:])
+            ),
+            dtype=np.float64,
+            count=len(matrix)
+        )
+
 class TriangleClassification(Evaluation):
     """Triangle classification class"""
     def __init__(self) -> None:
@@ -52,6 +144,17 @@ class TriangleClassification(Evaluation):
 
         return [data, score]
 
+    def score_batch(self, matrix, expected_solution: str) -> np.ndarray:
+        """Evaluates the generated data in one pass
+
+        I.E.
+        Expected solution input: equilateral
+        Input: [[3,3,3], [3,4,5]]
+        Output: [1., 0.]
+        """
+        classifications = self.classify_triangle_batch(matrix)
+        return (classifications == expected_solution).astype(np.float64)
+
     @staticmethod
     def classify_triangle(data: list) -> str:
         """
@@ -80,3 +183,72 @@ class TriangleClassification(Evaluation):
             classification = 'out of range'
 
         return classification
+
+    @staticmethod
+    def classify_triangle_batch(matrix) -> np.ndarray:
+        """
+        Classify every triangle of the given matrix using masks
+        Input: [[a, b, c], ...]
+        Output: array of 'scalene', 'equilateral', 'isosceles', 'invalid', 'out of range'
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        a = matrix[:, 0]
+        b = matrix[:, 1]
+        c = matrix[:, 2]
+
+        in_range = (a > 0) & (b > 0) & (c > 0)
+        valid = in_range & (a + b > c) & (b + c > a) & (c + a > b)
+        equal_ab = a == b
+        equal_bc = b == c
+        equal_ca = c == a
+        scalene = valid & ~equal_ab & ~equal_bc & ~equal_ca
+        equilateral = valid & equal_ab & equal_bc
+
+        return np.select(
+            [scalene, equilateral, valid, in_range],
+            ['scalene', 'equilateral', 'isosceles', 'invalid'],
+            default='out of range'
+        )
+
+class Sphere(Evaluation):
+    """Sphere class
+
+    Scores a chromosome with minus the sum of the squares of its gens, so
+    the fittest chromosome is the origin. The score is a sum over the
+    gens, so it can be updated incrementally when only some gens change
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._name = 'sphere'
+        self._expected_solutions = ['origin']
+
+    def score(self, data: list, expected_solution: str) -> list:
+        """Evaluates the generated data
+
+        I.E.
+        Input: [1, 2, 0]
+        Output: [[1, 2, 0], -5]
+        """
+        return [data, -sum(gen * gen for gen in data)]
+
+    def score_batch(self, matrix, expected_solution: str) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        return -np.einsum('ij,ij->i', matrix, matrix)
+
+    def score_delta(self, data: list, score: float, indexes: list, old_gens: list,
+                    expected_solution: str) -> float:
+        change = sum(data[i] * data[i] - old * old for i, old in zip(indexes, old_gens))
+        return score - change
+
+    def score_delta_batch(self, matrix, scores: np.ndarray, rows: np.ndarray,
+                          columns: np.ndarray, old_gens: np.ndarray,
+                          expected_solution: str) -> np.ndarray:
+        new_gens = np.asarray(matrix, dtype=np.float64)[rows, columns]
+        old_gens = np.asarray(old_gens, dtype=np.float64)
+        changes = np.bincount(
+            rows,
+            weights=new_gens * new_gens - old_gens * old_gens,
+            minlength=len(matrix)
+        )
+
+        return scores - changes
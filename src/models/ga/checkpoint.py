@@ -0,0 +1,94 @@
+"""This file is for defining the checkpoint files of the genetic algorithm
+
+A checkpoint is an uncompressed .npz file with the chromosome matrix, the
+fitness vector and a JSON document with the rest of the state (generation,
+random number generator states and configuration).
+"""
+import os
+from queue import Queue
+from threading import Thread
+
+import numpy as np
+
+def save_checkpoint(path: str, arrays: dict) -> None:
+    """Writes a checkpoint, replacing the previous one only once it is complete"""
+    temp_path = f'{path}.tmp'
+
+    with open(temp_path, 'wb') as file:
+        np.savez(file, **arrays)
+
+    os.replace(temp_path, path)
+
+def load_checkpoint(path: str) -> dict:
+    """Reads a checkpoint"""
+    with np.load(path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+class CheckpointWriter:
+    """Checkpoint writer class
+
+    Writes checkpoints in a background thread so the generation loop does
+    not wait for the disk. Only one checkpoint waits to be written at a
+    time; a new one blocks until the previous one has been taken.
+    """
+    def __init__(self) -> None:
+        self._queue = Queue(maxsize=1)
+        self._thread = None
+        self._error = None
+
+    def write(self, path: str, arrays: dict) -> None:
+        """Queues a checkpoint, the arrays must not be modified afterwards"""
+        self.raise_error()
+
+        if self._thread is None:
+            self._thread = Thread(target=self.run, name='checkpoint-writer', daemon=True)
+            self._thread.start()
+
+        self._queue.put((path, arrays))
+
+    def run(self) -> None:
+        """Writes the queued checkpoints until close() is called"""
+        while True:
+            checkpoint = self._queue.get()
+
+            if checkpoint is None:
+                return
+
+            try:
+                save_checkpoint(*checkpoint)
+            except OSError as error:
+                self._error = error
+
+    def close(self) -> None:
+        """Waits for the queued checkpoints to be written"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self.raise_error()
+
+    def raise_error(self) -> None:
+        """Raises the error of the last failed write, if any"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+def operator_state(operator) -> dict:
+    """Returns the type, parameters and random number generator state of an operator"""
+    params = {
+        name: value for name, value in vars(operator).items()
+        # The gen type of a mutation is set again before every mutation
+        if name not in ('_type', '_rng', '_gen')
+    }
+
+    return {
+        "type": operator.type,
+        "params": params,
+        "rng": operator.rng.bit_generator.state,
+    }
+
+def restore_operator(operator, state: dict) -> None:
+    """Restores the parameters and random number generator state of an operator"""
+    vars(operator).update(state["params"])
+    operator.rng.bit_generator.state = state["rng"]
@@ -1,20 +1,91 @@
 """This file is for defining the crossover classes"""
-from random import randint, shuffle
+import numpy as np
 
 class Crossover:
     """Crossover class"""
+    # Gen types whose chromosomes stay valid after the crossover
+    gen_types = ('real-number', 'integer', 'binary')
+
     def __init__(self) -> None:
         self._type = 'Crossover'
+        self._rng = np.random.default_rng()
 
     @property
     def type(self) -> str:
         """Get crossover type"""
         return self._type
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Get random number generator"""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        """Set random number generator"""
+        self._rng = rng
+
     def cross(self, chromo_len: int, parent1: list, parent2: list) -> list:
         """Crossover method"""
         raise NotImplementedError('Crossover method should be implemented by child class')
 
+    def cross_batch(self, parents: np.ndarray, pairs1: np.ndarray, pairs2: np.ndarray,
+                    out: np.ndarray = None) -> np.ndarray:
+        """Crosses every pair of parents in one call and keeps both children
+
+        The pair i is made of parents[pairs1[i]] and parents[pairs2[i]].
+        Its first child goes to row i and its second child to row
+        len(pairs1) + i. The children are written into out when it is
+        given, which must have between len(pairs1) and 2 * len(pairs1)
+        rows; the second children that do not fit are dropped.
+        Falls back to calling cross() once per pair
+        """
+        num_pairs, chromo_len = len(pairs1), parents.shape[1]
+        offspring = self._offspring(parents, num_pairs, out)
+
+        for i, (parent1, parent2) in enumerate(zip(parents[pairs1], parents[pairs2])):
+            child1, child2 = self.cross(chromo_len, list(parent1), list(parent2))
+            offspring[i] = child1
+
+            if num_pairs + i < len(offspring):
+                offspring[num_pairs + i] = child2
+
+        return offspring
+
+    @staticmethod
+    def _offspring(parents: np.ndarray, num_pairs: int, out: np.ndarray = None) -> np.ndarray:
+        """Returns the matrix the children are written into"""
+        if out is None:
+            return np.empty((2 * num_pairs, parents.shape[1]), dtype=parents.dtype)
+
+        if not num_pairs <= len(out) <= 2 * num_pairs:
+            raise ValueError('Offspring must have between 1 and 2 rows per pair')
+
+        return out
+
+    def _merge(self, mask: np.ndarray, parents: np.ndarray, pairs1: np.ndarray,
+               pairs2: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Builds both children of every pair from a mask
+
+        The first child takes the genes of its first parent where mask is
+        set and the genes of its second parent elsewhere, the second child
+        takes the opposite genes
+        """
+        num_pairs = len(pairs1)
+        offspring = self._offspring(parents, num_pairs, out)
+        first_children = offspring[:num_pairs]
+        second_children = offspring[num_pairs:]
+        num_second = len(second_children)
+        parents1 = parents[pairs1]
+        parents2 = parents[pairs2]
+
+        np.copyto(first_children, parents2)
+        np.copyto(first_children, parents1, where=mask)
+        np.copyto(second_children, parents1[:num_second])
+        np.copyto(second_children, parents2[:num_second], where=mask[:num_second])
+
+        return offspring
+
 class OnePoint(Crossover):
     """One point crossover class
 
@@ -26,12 +97,20 @@ class OnePoint(Crossover):
 
     def cross(self, chromo_len: int, parent1: list, parent2: list) -> list:
         # Creates children
-        point = randint(1, chromo_len - 1)
+        point = self._rng.integers(1, chromo_len - 1, endpoint=True)
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
 
         return [child1, child2]
 
+    def cross_batch(self, parents: np.ndarray, pairs1: np.ndarray, pairs2: np.ndarray,
+                    out: np.ndarray = None) -> np.ndarray:
+        chromo_len = parents.shape[1]
+        points = self._rng.integers(1, chromo_len, size=(len(pairs1), 1))
+        mask = np.arange(chromo_len) < points
+
+        return self._merge(mask, parents, pairs1, pairs2, out)
+
 class TwoPoint(Crossover):
     """Two point crossover class
 
@@ -42,13 +121,23 @@ class TwoPoint(Crossover):
         self._type = 'two-point'
 
     def cross(self, chromo_len: int, parent1: list, parent2: list) -> list:
-        point1 = randint(1, (chromo_len - 2))
-        point2 = randint(point1 + 1, (chromo_len - 1))
+        point1 = self._rng.integers(1, chromo_len - 2, endpoint=True)
+        point2 = self._rng.integers(point1 + 1, chromo_len - 1, endpoint=True)
         child1 = parent1[:point1] + parent2[point1:point2] + parent1[point2:]
         child2 = parent2[:point1] + parent1[point1:point2] + parent2[point2:]
 
         return [child1, child2]
 
+    def cross_batch(self, parents: np.ndarray, pairs1: np.ndarray, pairs2: np.ndarray,
+                    out: np.ndarray = None) -> np.ndarray:
+        chromo_len = parents.shape[1]
+        points1 = self._rng.integers(1, chromo_len - 1, size=(len(pairs1), 1))
+        points2 = self._rng.integers(points1 + 1, chromo_len)
+        genes = np.arange(chromo_len)
+        mask = (genes < points1) | (genes >= points2)
+
+        return self._merge(mask, parents, pairs1, pairs2, out)
+
 class Uniform(Crossover):
     """Uniform crossover class
 
@@ -59,13 +148,96 @@ class Uniform(Crossover):
         self._type = 'uniform'
 
     def cross(self, chromo_len: int, parent1: list, parent2: list) -> list:
-        parents = [parent1, parent2]
-
         child1 = []
         child2 = []
-        for gen in range(chromo_len):
-            shuffle(parents)
-            child1.append(parents[0][gen])
-            child2.append(parents[1][gen])
+        swaps = self._rng.random(len(parent1)) < 0.5
+        for gen1, gen2, swap in zip(parent1, parent2, swaps.tolist()):
+            if swap:
+                gen1, gen2 = gen2, gen1
+            child1.append(gen1)
+            child2.append(gen2)
 
         return [child1, child2]
+
+    def cross_batch(self, parents: np.ndarray, pairs1: np.ndarray, pairs2: np.ndarray,
+                    out: np.ndarray = None) -> np.ndarray:
+        mask = self._rng.random((len(pairs1), parents.shape[1])) < 0.5
+
+        return self._merge(mask, parents, pairs1, pairs2, out)
+
+class Order(Crossover):
+    """Order crossover class
+
+    Every child keeps a segment of one parent in place and takes the
+    remaining gens in the order they have in the other parent, starting
+    after the segment, so permutations stay permutations
+    """
+    gen_types = ('permutation',)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = 'order'
+
+    def cross(self, chromo_len: int, parent1: list, parent2: list) -> list:
+        point1 = self._rng.integers(0, chromo_len)
+        point2 = self._rng.integers(point1 + 1, chromo_len, endpoint=True)
+
+        return [
+            self.order(parent1, parent2, point1, point2),
+            self.order(parent2, parent1, point1, point2),
+        ]
+
+    @staticmethod
+    def order(parent1: list, parent2: list, point1: int, point2: int) -> list:
+        """Builds the child keeping parent1[point1:point2]"""
+        segment = parent1[point1:point2]
+        kept = set(segment)
+        rest = [gen for gen in parent2[point2:] + parent2[:point2] if gen not in kept]
+        num_tail = len(parent1) - point2
+
+        return rest[num_tail:] + segment + rest[:num_tail]
+
+    def cross_batch(self, parents: np.ndarray, pairs1: np.ndarray, pairs2: np.ndarray,
+                    out: np.ndarray = None) -> np.ndarray:
+        num_pairs, chromo_len = len(pairs1), parents.shape[1]
+        offspring = self._offspring(parents, num_pairs, out)
+        num_second = len(offspring) - num_pairs
+        points1 = self._rng.integers(0, chromo_len, size=(num_pairs, 1))
+        points2 = self._rng.integers(points1 + 1, chromo_len, endpoint=True)
+        parents1 = parents[pairs1]
+        parents2 = parents[pairs2]
+
+        offspring[:num_pairs] = self.order_batch(parents1, parents2, points1, points2)
+        offspring[num_pairs:] = self.order_batch(
+            parents2[:num_second],
+            parents1[:num_second],
+            points1[:num_second],
+            points2[:num_second]
+        )
+
+        return offspring
+
+    @staticmethod
+    def order_batch(parents1: np.ndarray, parents2: np.ndarray, points1: np.ndarray,
+                    points2: np.ndarray) -> np.ndarray:
+        """Builds the children keeping parents1[:, points1:points2], row by row"""
+        num_chromos, chromo_len = parents1.shape
+        rows = np.arange(num_chromos)[:, None]
+        genes = np.arange(chromo_len)
+
+        # Position of every gen in its first parent
+        positions = np.empty((num_chromos, chromo_len), dtype=np.intp)
+        positions[rows, parents1] = genes
+
+        # The second parent read from the end of the segment, without the segment gens
+        after_segment = (points2 + genes) % chromo_len
+        rolled = parents2[rows, after_segment]
+        rolled_positions = positions[rows, rolled]
+        outside = (rolled_positions < points1) | (rolled_positions >= points2)
+
+        # Every row has the same number of gens outside its segment as free places
+        free = genes < chromo_len - (points2 - points1)
+        children = parents1.copy()
+        children[np.broadcast_to(rows, free.shape)[free], after_segment[free]] = rolled[outside]
+
+        return children
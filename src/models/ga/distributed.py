@@ -0,0 +1,336 @@
+"""This file is for defining the distributed evaluation executor
+
+The coordinator serves a task queue and a result queue over TCP with a
+multiprocessing manager. Workers connect to it from this machine or from
+other machines and score the chunks of chromosomes they take from the
+task queue.
+
+A remote worker is started with:
+    python -m src.models.ga.distributed --address HOST:PORT --authkey KEY
+"""
+import argparse
+import multiprocessing
+import pickle
+import queue
+import traceback
+from collections import deque
+from itertools import count
+from multiprocessing.managers import BaseManager
+from os import urandom
+from time import monotonic
+
+import numpy as np
+
+from src.models.ga.executor import Executor
+
+class TaskQueue(queue.Queue):
+    """Task queue whose tasks can be taken back before a worker gets them"""
+    def discard(self, task_ids: list) -> int:
+        """Removes the queued tasks with the given ids, returns how many were removed"""
+        task_ids = set(task_ids)
+
+        with self.mutex:
+            kept = deque(task for task in self.queue if task is None or task[0] not in task_ids)
+            removed = len(self.queue) - len(kept)
+            self.queue = kept
+
+        return removed
+
+# Queues living in the manager server process
+TASKS = TaskQueue()
+RESULTS = queue.Queue()
+
+def get_tasks() -> TaskQueue:
+    """Returns the task queue of the manager server"""
+    return TASKS
+
+def get_results() -> queue.Queue:
+    """Returns the result queue of the manager server"""
+    return RESULTS
+
+class QueueManager(BaseManager):
+    """Manager sharing the task and result queues"""
+
+QueueManager.register('get_tasks', callable=get_tasks)
+QueueManager.register('get_results', callable=get_results)
+
+def run_worker(address: tuple, authkey: bytes, poll_interval: float = 1.0) -> None:
+    """Scores chunks of chromosomes until the coordinator goes away
+
+    Tasks are (task_id, payload) where the payload is the pickled
+    (evaluation, chunk, expected_solution). Results are (task_id, payload)
+    where the payload is the pickled (scores, error)
+    """
+    manager = QueueManager(address=address, authkey=authkey)
+    manager.connect()
+    tasks = manager.get_tasks()
+    results = manager.get_results()
+
+    while True:
+        try:
+            task = tasks.get(timeout=poll_interval)
+        except queue.Empty:
+            continue
+        except (EOFError, OSError):
+            return
+
+        if task is None:
+            return
+
+        task_id, payload = task
+
+        try:
+            evaluation, chunk, expected_solution = pickle.loads(payload)
+            result = (evaluation.score_batch(chunk, expected_solution), None)
+        except Exception:  # pylint: disable=broad-except
+            result = (None, traceback.format_exc())
+
+        try:
+            results.put((task_id, pickle.dumps(result)))
+        except (EOFError, OSError):
+            return
+
+class DistributedExecutor(Executor):
+    """Distributed executor class
+
+    Sends the population in chunks to workers connected over TCP.
+    - Batching: every task is one chunk of chunk_size chromosomes.
+    - Back-pressure: at most max_pending tasks are queued or running.
+    - Retry: a task without result after task_timeout seconds is taken
+      back from the task queue, if no worker got it yet, and sent again,
+      up to max_retries times.
+
+    local_workers worker processes are started on this machine, so it
+    also works with no remote worker at all. The coordinator and the
+    workers are kept across executions, so remote workers stay connected
+    and local workers are started once; shutdown() stops them.
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(workers, chunk_size)
+        self._type = 'distributed'
+        self._address = ('127.0.0.1', 0)
+        self._authkey = urandom(16)
+        self._local_workers = None
+        self._max_pending = None
+        self._task_timeout = 60.0
+        self._max_retries = 3
+        self._manager = None
+        self._tasks = None
+        self._results = None
+        self._processes = []
+        self._task_ids = count()
+
+    @property
+    def address(self) -> tuple:
+        """Get (host, port) the coordinator listens on, port 0 means any free port"""
+        if self._manager is not None:
+            return self._manager.address
+
+        return self._address
+
+    @address.setter
+    def address(self, address: tuple) -> None:
+        """Set (host, port) the coordinator listens on"""
+        self.shutdown()
+        self._address = tuple(address)
+
+    @property
+    def authkey(self) -> bytes:
+        """Get key the workers must use to connect"""
+        return self._authkey
+
+    @authkey.setter
+    def authkey(self, authkey: bytes) -> None:
+        """Set key the workers must use to connect"""
+        self.shutdown()
+        self._authkey = authkey
+
+    @property
+    def local_workers(self) -> int:
+        """Get number of workers started on this machine, workers by default"""
+        if self._local_workers is None:
+            return self._workers
+
+        return self._local_workers
+
+    @local_workers.setter
+    def local_workers(self, local_workers: int) -> None:
+        """Set number of workers started on this machine"""
+        if local_workers >= 0:
+            self.shutdown()
+            self._local_workers = local_workers
+        else:
+            raise ValueError('Number of local workers must not be negative')
+
+    @property
+    def max_pending(self) -> int:
+        """Get maximum number of tasks queued or running at once, twice workers by default"""
+        if self._max_pending is None:
+            return 2 * self._workers
+
+        return self._max_pending
+
+    @max_pending.setter
+    def max_pending(self, max_pending: int) -> None:
+        """Set maximum number of tasks queued or running at once"""
+        if max_pending >= 1:
+            self._max_pending = max_pending
+        else:
+            raise ValueError('Maximum number of pending tasks must be at least 1')
+
+    @property
+    def task_timeout(self) -> float:
+        """Get seconds to wait for a task before sending it again"""
+        return self._task_timeout
+
+    @task_timeout.setter
+    def task_timeout(self, task_timeout: float) -> None:
+        """Set seconds to wait for a task before sending it again"""
+        if task_timeout > 0:
+            self._task_timeout = task_timeout
+        else:
+            raise ValueError('Task timeout must be greater than 0')
+
+    @property
+    def max_retries(self) -> int:
+        """Get number of times a lost task is sent again"""
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, max_retries: int) -> None:
+        """Set number of times a lost task is sent again"""
+        if max_retries >= 0:
+            self._max_retries = max_retries
+        else:
+            raise ValueError('Maximum number of retries must not be negative')
+
+    def start(self) -> None:
+        """Starts the coordinator and the local workers, if not running yet"""
+        if self._manager is not None:
+            return
+
+        self._manager = QueueManager(address=self._address, authkey=self._authkey)
+        self._manager.start()
+        self._tasks = self._manager.get_tasks()
+        self._results = self._manager.get_results()
+
+        context = multiprocessing.get_context()
+        self._processes = [
+            context.Process(
+                target=run_worker,
+                args=(self._manager.address, self._authkey),
+                daemon=True
+            )
+            for _ in range(self.local_workers)
+        ]
+
+        for process in self._processes:
+            process.start()
+
+    def score(self, evaluation, pop, expected_solution: str) -> np.ndarray:
+        if not len(pop):
+            return np.empty(0, dtype=np.float64)
+
+        self.start()
+        chunks = self.chunks(pop)
+        scores = [None] * len(chunks)
+        attempts = [0] * len(chunks)
+        waiting = deque(range(len(chunks)))
+        submitted = {}
+        in_flight = {}
+        num_done = 0
+
+        try:
+            while num_done < len(chunks):
+                # Back-pressure: only max_pending tasks are queued or running
+                while waiting and len(in_flight) < self.max_pending:
+                    chunk_index = waiting.popleft()
+                    task_id = next(self._task_ids)
+                    payload = pickle.dumps((evaluation, chunks[chunk_index], expected_solution))
+                    self._tasks.put((task_id, payload))
+                    attempts[chunk_index] += 1
+                    submitted[task_id] = chunk_index
+                    in_flight[task_id] = monotonic() + self._task_timeout
+
+                try:
+                    task_id, payload = self._results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+                else:
+                    in_flight.pop(task_id, None)
+                    chunk_index = submitted.get(task_id)
+
+                    # Results of other populations or of already retried tasks are dropped
+                    if chunk_index is not None and scores[chunk_index] is None:
+                        chunk_scores, error = pickle.loads(payload)
+
+                        if error is not None:
+                            raise RuntimeError(f'Evaluation failed in a worker:\n{error}')
+
+                        scores[chunk_index] = chunk_scores
+                        num_done += 1
+
+                        copies = [i for i in in_flight if submitted[i] == chunk_index]
+
+                        for other_id in copies:
+                            del in_flight[other_id]
+
+                        if copies:
+                            self._tasks.discard(copies)
+
+                now = monotonic()
+
+                for task_id, deadline in list(in_flight.items()):
+                    if deadline < now:
+                        del in_flight[task_id]
+                        chunk_index = submitted[task_id]
+
+                        if attempts[chunk_index] > self._max_retries:
+                            raise RuntimeError(
+                                'Evaluation task lost after', self._max_retries, 'retries'
+                            )
+
+                        # The stale copy may still be queued behind a slow worker
+                        self._tasks.discard([task_id])
+                        waiting.appendleft(chunk_index)
+        finally:
+            # Copies still queued, e.g. after an error, must not be evaluated later
+            if in_flight:
+                self._tasks.discard(list(in_flight))
+
+        return np.concatenate(scores)
+
+    def release(self) -> None:
+        """Keeps the coordinator and the workers for the next execution"""
+
+    def shutdown(self) -> None:
+        if self._manager is None:
+            return
+
+        for _ in self._processes:
+            self._tasks.put(None)
+
+        for process in self._processes:
+            process.join(timeout=5)
+
+            if process.is_alive():
+                process.terminate()
+
+        self._manager.shutdown()
+        self._manager = None
+        self._tasks = None
+        self._results = None
+        self._processes = []
+
+def main():
+    """Main function to run a remote worker"""
+    parser = argparse.ArgumentParser(description='Distributed evaluation worker')
+    parser.add_argument('--address', required=True, help='HOST:PORT of the coordinator')
+    parser.add_argument('--authkey', required=True, help='key of the coordinator')
+    args = parser.parse_args()
+
+    host, port = args.address.rsplit(':', 1)
+    run_worker((host, int(port)), args.authkey.encode())
+
+if __name__ == '__main__':
+    main()
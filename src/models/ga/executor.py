@@ -0,0 +1,161 @@
+"""This file is for defining the evaluation executor class and its child classes"""
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from os import cpu_count
+
+import numpy as np
+
+def score_chunk(evaluation, chunk, expected_solution: str) -> np.ndarray:
+    """Scores one chunk of chromosomes inside a worker"""
+    return evaluation.score_batch(chunk, expected_solution)
+
+class Executor:
+    """Executor class
+
+    Runs the evaluation of a population and returns the fitness array
+    in the original order of the chromosomes
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        self._type = 'Executor'
+        self._workers = workers or cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    @property
+    def type(self) -> str:
+        """Get executor type"""
+        return self._type
+
+    @property
+    def workers(self) -> int:
+        """Get number of workers"""
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int) -> None:
+        """Set number of workers"""
+        if workers >= 1:
+            self.shutdown()
+            self._workers = workers
+        else:
+            raise ValueError('Number of workers must be at least 1')
+
+    @property
+    def chunk_size(self) -> int:
+        """Get chunk size, None means one chunk per worker pass"""
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int) -> None:
+        """Set chunk size"""
+        if chunk_size is None or chunk_size >= 1:
+            self._chunk_size = chunk_size
+        else:
+            raise ValueError('Chunk size must be at least 1')
+
+    def chunks(self, pop) -> list:
+        """Splits the population in chunks of chunk_size chromosomes
+
+        Without a chunk size, the population is split in four chunks per
+        worker so the workers stay busy while keeping the IPC overhead low
+        """
+        chunk_size = self._chunk_size or -(-len(pop) // (self._workers * 4)) or 1
+        return [pop[i:i + chunk_size] for i in range(0, len(pop), chunk_size)]
+
+    def score(self, evaluation, pop, expected_solution: str) -> np.ndarray:
+        """Scores the population and returns the fitness array"""
+        raise NotImplementedError('Score method should be implemented by child class')
+
+    def submit(self, evaluation, pop, expected_solution: str) -> Future:
+        """Starts scoring the population and returns a future of the fitness array
+
+        Falls back to scoring it right away with score()
+        """
+        future = Future()
+        future.set_result(self.score(evaluation, pop, expected_solution))
+        return future
+
+    def shutdown(self) -> None:
+        """Releases the workers, if any"""
+
+    def release(self) -> None:
+        """Called when an execution ends, shuts the workers down by default"""
+        self.shutdown()
+
+class SerialExecutor(Executor):
+    """Serial executor class
+
+    Scores the population in the calling thread
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(workers, chunk_size)
+        self._type = 'serial'
+
+    def score(self, evaluation, pop, expected_solution: str) -> np.ndarray:
+        return evaluation.score_batch(pop, expected_solution)
+
+class PoolExecutor(Executor):
+    """Pool executor class
+
+    Sends the population to a pool of workers in chunks. The pool is
+    created on first use and kept alive across generations
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(workers, chunk_size)
+        self._pool = None
+
+    def create_pool(self):
+        """Creates the pool of workers"""
+        raise NotImplementedError('Create pool method should be implemented by child class')
+
+    def score(self, evaluation, pop, expected_solution: str) -> np.ndarray:
+        if not len(pop):
+            return np.empty(0, dtype=np.float64)
+
+        if self._pool is None:
+            self._pool = self.create_pool()
+
+        chunks = self.chunks(pop)
+        scores = self._pool.map(
+            score_chunk,
+            [evaluation] * len(chunks),
+            chunks,
+            [expected_solution] * len(chunks)
+        )
+
+        return np.concatenate(list(scores))
+
+    def submit(self, evaluation, pop, expected_solution: str) -> Future:
+        if self._pool is None:
+            self._pool = self.create_pool()
+
+        return self._pool.submit(score_chunk, evaluation, pop, expected_solution)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+class ThreadExecutor(PoolExecutor):
+    """Thread executor class
+
+    Scores the population in a thread pool, useful for evaluations that
+    release the GIL (numpy, I/O)
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(workers, chunk_size)
+        self._type = 'thread'
+
+    def create_pool(self):
+        return ThreadPoolExecutor(max_workers=self._workers)
+
+class ProcessExecutor(PoolExecutor):
+    """Process executor class
+
+    Scores the population in a process pool, useful for expensive
+    pure Python evaluations
+    """
+    def __init__(self, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(workers, chunk_size)
+        self._type = 'process'
+
+    def create_pool(self):
+        return ProcessPoolExecutor(max_workers=self._workers)
@@ -0,0 +1,111 @@
+"""This file is for defining the fitness cache"""
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
+
+class FitnessCache:
+    """Fitness cache class
+
+    Remembers the fitness of the chromosomes already scored, keyed on a
+    hash of the evaluation, the expected solution, the dtype and length of
+    the chromosomes and the chromosome.
+    The least recently used entries are evicted once max_size is reached.
+    """
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._scores = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """Get maximum number of cached scores"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        """Set maximum number of cached scores"""
+        if max_size >= 1:
+            self._max_size = max_size
+            self.evict()
+        else:
+            raise ValueError('Cache size must be at least 1')
+
+    @property
+    def hits(self) -> int:
+        """Get number of scores served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of scores that had to be evaluated"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def clear(self) -> None:
+        """Removes every cached score and resets the counters"""
+        self._scores.clear()
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """Resets the hit and miss counters and keeps the cached scores"""
+        self._hits = 0
+        self._misses = 0
+
+    def evict(self) -> None:
+        """Removes the least recently used scores above max_size"""
+        while len(self._scores) > self._max_size:
+            self._scores.popitem(last=False)
+
+    @staticmethod
+    def key(prefix: bytes, chromo: np.ndarray) -> bytes:
+        """Hashes a chromosome"""
+        return blake2b(prefix + chromo.tobytes(), digest_size=16).digest()
+
+    def score(self, pop, prefix: str, score_misses) -> np.ndarray:
+        """Scores the population using the cached scores
+
+        The chromosomes that are not cached are scored once each, even if
+        they are repeated, with score_misses(sub_pop) -> fitness array.
+        """
+        # Arrays are hashed in their own compact dtype, lists of gens as floats
+        dtype = pop.dtype if isinstance(pop, np.ndarray) else np.float64
+        matrix = np.ascontiguousarray(pop, dtype=dtype)
+        # Chromosomes of other gen types or lengths can have the same bytes
+        prefix = f'{prefix}|{matrix.dtype.str}|{matrix.shape[1:]}|'.encode()
+        scores = np.empty(len(matrix), dtype=np.float64)
+        missing = OrderedDict()
+
+        for i, chromo in enumerate(matrix):
+            key = self.key(prefix, chromo)
+            score = self._scores.get(key)
+
+            if score is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                self._scores.move_to_end(key)
+                scores[i] = score
+
+        self._misses += len(missing)
+        self._hits += len(matrix) - len(missing)
+
+        if missing:
+            indexes = [same_chromos[0] for same_chromos in missing.values()]
+
+            if isinstance(pop, np.ndarray):
+                sub_pop = pop[indexes]
+            else:
+                sub_pop = [pop[i] for i in indexes]
+
+            missing_scores = score_misses(sub_pop).tolist()
+
+            for (key, same_chromos), score in zip(missing.items(), missing_scores):
+                scores[same_chromos] = score
+                self._scores[key] = score
+
+            self.evict()
+
+        return scores
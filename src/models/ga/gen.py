@@ -1,18 +1,50 @@
-from random import uniform
+import numpy as np
 
 class Gen:
     """Gen class"""
     def __init__(self) -> None:
         self._type = 'Gen'
+        self._rng = np.random.default_rng()
 
     @property
     def type(self) -> str:
         return self._type
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Get dtype of the arrays holding these gens"""
+        return np.dtype(np.float64)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Get random number generator"""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        """Set random number generator"""
+        self._rng = rng
+
     def create(self):
         """Create gen method"""
         raise NotImplementedError('Create method should be implemented by child class')
 
+    def create_batch(self, shape) -> np.ndarray:
+        """Create an array of gens with the given shape
+
+        Falls back to calling create() once per gen
+        """
+        size = int(np.prod(shape))
+        gens = np.fromiter((self.create() for _ in range(size)), dtype=self.dtype, count=size)
+        return gens.reshape(shape)
+
+    def create_chromosome(self, chromo_len: int) -> list:
+        """Create the gens of a chromosome
+
+        Draws them in one create_batch() call
+        """
+        return self.create_batch(chromo_len).tolist()
+
 class RealNumber(Gen):
     """Real number class"""
     def __init__(self):
@@ -45,4 +77,119 @@ class RealNumber(Gen):
 
     def create(self):
         """Create real number gen"""
-        return uniform(self.min_value, self.max_value)
\ No newline at end of file
+        return self._rng.uniform(self.min_value, self.max_value)
+
+    def create_batch(self, shape) -> np.ndarray:
+        """Create an array of real number gens"""
+        return self._rng.uniform(self.min_value, self.max_value, size=shape)
+
+class Integer(Gen):
+    """Bounded integer class
+
+    The gens are integers between min value and max value, both included,
+    held in the smallest of int16, int32 and int64 that fits the range
+    """
+    def __init__(self):
+        super().__init__()
+        self._type = 'integer'
+        self._min_value = -100
+        self._max_value = 100
+
+    @property
+    def min_value(self) -> int:
+        return self._min_value
+
+    @min_value.setter
+    def min_value(self, value: int) -> None:
+        if value < self._max_value:
+            self._min_value = int(value)
+        else:
+            raise ValueError('Min value must be less than max value')
+
+    @property
+    def max_value(self) -> int:
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, value: int) -> None:
+        if value > self._min_value:
+            self._max_value = int(value)
+        else:
+            raise ValueError('Max value must be greater than min value')
+
+    @property
+    def dtype(self) -> np.dtype:
+        for dtype in (np.int16, np.int32):
+            info = np.iinfo(dtype)
+
+            if info.min <= self._min_value and self._max_value <= info.max:
+                return np.dtype(dtype)
+
+        return np.dtype(np.int64)
+
+    def create(self):
+        """Create integer gen"""
+        return int(self._rng.integers(self._min_value, self._max_value, endpoint=True))
+
+    def create_batch(self, shape) -> np.ndarray:
+        """Create an array of integer gens"""
+        return self._rng.integers(
+            self._min_value,
+            self._max_value,
+            size=shape,
+            dtype=self.dtype,
+            endpoint=True
+        )
+
+class Binary(Gen):
+    """Binary class
+
+    The gens are booleans, held in bool arrays (one byte per gen) and
+    packed into bits in the checkpoints
+    """
+    def __init__(self):
+        super().__init__()
+        self._type = 'binary'
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.bool_)
+
+    def create(self):
+        """Create binary gen"""
+        return bool(self._rng.integers(0, 2))
+
+    def create_batch(self, shape) -> np.ndarray:
+        """Create an array of binary gens"""
+        return self._rng.integers(0, 2, size=shape, dtype=np.bool_)
+
+class Permutation(Gen):
+    """Permutation class
+
+    Every chromosome is an ordering of the numbers from 0 to chromo len - 1,
+    held in int16 arrays. The gens of a permutation are not
+    independent, so they are only created a whole chromosome at a time and
+    only the crossovers and mutations that keep permutations can be used
+    """
+    def __init__(self):
+        super().__init__()
+        self._type = 'permutation'
+
+    @property
+    def dtype(self) -> np.dtype:
+        # The chromosome length is capped at 9999, so int16 always fits
+        return np.dtype(np.int16)
+
+    def create(self):
+        raise ValueError('Permutation gens can only be created a whole chromosome at a time')
+
+    def create_batch(self, shape) -> np.ndarray:
+        """Create a matrix with a random permutation per row"""
+        _, chromo_len = shape
+        orderings = np.broadcast_to(np.arange(chromo_len, dtype=self.dtype), shape)
+
+        return self._rng.permuted(orderings, axis=1)
+
+    def create_chromosome(self, chromo_len: int) -> list:
+        """Create a random permutation"""
+        return self._rng.permutation(chromo_len).tolist()
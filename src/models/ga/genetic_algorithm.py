@@ -1,11 +1,43 @@
 """This file is for defining the genetic algorithm"""
-from random import choice
+import asyncio
+import json
+from collections import deque
+from copy import deepcopy
+from heapq import nlargest, nsmallest
+from operator import itemgetter
+
+import numpy as np
 
 from src.models.algorithm import Algorithm
-from src.models.ga.crossover import OnePoint, TwoPoint, Uniform
-from src.models.ga.gen import RealNumber
-from src.models.ga.mutation import RandomResetting
-from src.models.ga.selection import RandomSelection, SteadyState
+from src.models.ga.checkpoint import (
+    CheckpointWriter,
+    load_checkpoint,
+    operator_state,
+    restore_operator,
+    save_checkpoint,
+)
+from src.models.ga.crossover import OnePoint, Order, TwoPoint, Uniform
+from src.models.ga.distributed import DistributedExecutor
+from src.models.ga.executor import ProcessExecutor, SerialExecutor, ThreadExecutor
+from src.models.ga.fitness_cache import FitnessCache
+from src.models.ga.gen import Binary, Integer, Permutation, RealNumber
+from src.models.ga.mutation import Gaussian, RandomResetting, Swap
+from src.models.ga.profiling import Profiler
+from src.models.ga.run_history import RunHistoryWriter
+from src.models.ga.stopping import (
+    EvaluationBudget,
+    LowDiversity,
+    NoImprovement,
+    TargetFitness,
+    TimeBudget,
+)
+from src.models.ga.selection import (
+    RandomSelection,
+    Roulette,
+    SteadyState,
+    StochasticUniversalSampling,
+    Tournament,
+)
 
 class GeneticAlgorithm(Algorithm):
     """Class for the configuration and execution of the genetic algorithm
@@ -21,24 +53,52 @@ class GeneticAlgorithm(Algorithm):
     - current population
     - evaluation (fitness function)
     - expected solution
+    - evaluation executor type, workers and chunk size
+    - history retention policy and size
+    - run history path
+    - fitness cache and its size
+    - incremental evaluation threshold
+    - elitism and duplicate elimination
+    - concurrency and call timeout of the asynchronous evaluation
+    - seed of the random number generators
+    - stopping criteria
+    - checkpoint path and interval
+    - profiling and its metrics hook
     """
+    duplicate_retries = 10
+
     def __init__(self) -> None:
         super().__init__()
         self._name = 'genetic-algorithm'
         self._gens = [
             ['real-number', RealNumber],
+            ['integer', Integer],
+            ['binary', Binary],
+            ['permutation', Permutation],
         ]
         self._selections = [
             ['random', RandomSelection],
             ['steady-state', SteadyState],
+            ['tournament', Tournament],
+            ['roulette', Roulette],
+            ['stochastic-universal-sampling', StochasticUniversalSampling],
         ]
         self._crossovers = [
             ['one-point', OnePoint],
             ['two-point', TwoPoint],
             ['uniform', Uniform],
+            ['order', Order],
         ]
         self._mutations = [
             ['random-resetting', RandomResetting],
+            ['gaussian', Gaussian],
+            ['swap', Swap],
+        ]
+        self._executors = [
+            ['serial', SerialExecutor],
+            ['thread', ThreadExecutor],
+            ['process', ProcessExecutor],
+            ['distributed', DistributedExecutor],
         ]
         self._gen = RealNumber()
         self._chromo_len = 3
@@ -47,6 +107,40 @@ class GeneticAlgorithm(Algorithm):
         self._selection = RandomSelection(0.5)
         self._crossover = Uniform()
         self._mutation = RandomResetting(0.3)
+        self._executor = SerialExecutor()
+        self._histories = ['none', 'summary', 'last-n', 'full']
+        self._history = 'full'
+        self._history_size = 1
+        self._history_path = None
+        self._fitness_cache = False
+        self._cache = FitnessCache(100000)
+        self._stopping_criterion_types = [
+            ['target-fitness', TargetFitness],
+            ['no-improvement', NoImprovement],
+            ['low-diversity', LowDiversity],
+            ['time-budget', TimeBudget],
+            ['evaluation-budget', EvaluationBudget],
+        ]
+        self._stopping_criteria = []
+        self._stop_reason = None
+        self._num_generations_run = 0
+        self._num_evaluations = 0
+        self._num_delta_evaluations = 0
+        self._delta_threshold = 0
+        self._parents = None
+        self._elitism = 0
+        self._duplicate_elimination = False
+        self._num_duplicates = 0
+        self._concurrency = 16
+        self._call_timeout = None
+        self._loop = None
+        self._checkpoint_path = None
+        self._checkpoint_interval = 10
+        self._resume_generation = None
+        self._profiling = False
+        self._metrics_hook = None
+        self._metrics = None
+        self.seed = None
         self._current_pop = []
 
     @property
@@ -60,6 +154,7 @@ class GeneticAlgorithm(Algorithm):
         for name, gen in self._gens:
             if gen_type == name:
                 self._gen = gen()
+                self._gen.rng = self.spawn_rng()
                 return
 
         raise ValueError('Gen type must be a valid value: ', self._gens)
@@ -92,15 +187,11 @@ class GeneticAlgorithm(Algorithm):
     def pop_size(self, pop_size: int):
         """Set population size"""
         min_pop = 1
-        max_pop = 10
 
-        if min_pop <= pop_size <= max_pop:
+        if min_pop <= pop_size:
             self._pop_size = pop_size
         else:
-            raise ValueError(
-                'Population must be between',
-                min_pop,'and',max_pop
-            )
+            raise ValueError('Population must be at least', min_pop)
 
     @property
     def num_generations(self) -> int:
@@ -111,15 +202,11 @@ class GeneticAlgorithm(Algorithm):
     def num_generations(self, num_generations: int):
         """Set number of generations"""
         min_generations = 1
-        max_generations = 10
 
-        if min_generations <= num_generations <= max_generations:
+        if min_generations <= num_generations:
             self._num_generations = num_generations
         else:
-            raise ValueError(
-                'Number of generations must be between',
-                min_generations,'and',max_generations
-            )
+            raise ValueError('Number of generations must be at least', min_generations)
 
     @property
     def selection_rate(self) -> float:
@@ -145,6 +232,7 @@ class GeneticAlgorithm(Algorithm):
         for name, selection in self._selections:
             if selection_type == name:
                 self._selection = selection(self._selection.rate)
+                self._selection.rng = self.spawn_rng()
                 return
 
         raise ValueError('Selection type must be a valid value: ', self._selections)
@@ -160,6 +248,7 @@ class GeneticAlgorithm(Algorithm):
         for name, crossover in self._crossovers:
             if crossover_type == name:
                 self._crossover = crossover()
+                self._crossover.rng = self.spawn_rng()
                 return
 
         raise ValueError('Crossover type must be a valid value: ', self._crossovers)
@@ -188,9 +277,358 @@ class GeneticAlgorithm(Algorithm):
         for name, mutation in self._mutations:
             if mutation_type == name:
                 self._mutation = mutation(self._mutation.rate)
+                self._mutation.rng = self.spawn_rng()
                 return
         raise ValueError('Mutation type must be a valid value: ', self._mutations)
 
+    @property
+    def seed(self) -> int:
+        """Get seed of the random number generators"""
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: int):
+        """Set seed of the random number generators
+
+        Every operator gets its own independent stream spawned from the
+        seed, so runs with the same seed and configuration are reproducible.
+        None seeds from fresh OS entropy
+        """
+        if seed is not None and seed < 0:
+            raise ValueError('Seed must be a non negative integer or None')
+
+        self._seed = seed
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._rng = self.spawn_rng()
+
+        for operator in (self._gen, self._selection, self._crossover, self._mutation):
+            operator.rng = self.spawn_rng()
+
+    def spawn_seeds(self, num_seeds: int) -> list:
+        """Spawns independent child seed sequences, e.g. one per worker"""
+        return self._seed_sequence.spawn(num_seeds)
+
+    def spawn_rng(self) -> np.random.Generator:
+        """Spawns an independent random number generator"""
+        return np.random.default_rng(self.spawn_seeds(1)[0])
+
+    @property
+    def executor_type(self) -> str:
+        """Get evaluation executor type"""
+        return self._executor.type
+
+    @executor_type.setter
+    def executor_type(self, executor_type: str):
+        """Set evaluation executor type"""
+        for name, executor in self._executors:
+            if executor_type == name:
+                self._executor.shutdown()
+                self._executor = executor(self._executor.workers, self._executor.chunk_size)
+                return
+
+        raise ValueError('Executor type must be a valid value: ', self._executors)
+
+    @property
+    def executor(self):
+        """Get evaluation executor, to set the attributes of its own"""
+        return self._executor
+
+    @property
+    def workers(self) -> int:
+        """Get number of evaluation workers"""
+        return self._executor.workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        """Set number of evaluation workers"""
+        self._executor.workers = workers
+
+    @property
+    def chunk_size(self) -> int:
+        """Get number of chromosomes sent to a worker at once"""
+        return self._executor.chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int):
+        """Set number of chromosomes sent to a worker at once"""
+        self._executor.chunk_size = chunk_size
+
+    @property
+    def history(self) -> str:
+        """Get history retention policy"""
+        return self._history
+
+    @history.setter
+    def history(self, history: str):
+        """Set history retention policy
+
+        - none: no generation is kept
+        - summary: only the fitness summary of every generation is kept
+        - last-n: every population of the last history_size generations is kept
+        - full: every population of every generation is kept
+        """
+        if history in self._histories:
+            self._history = history
+        else:
+            raise ValueError('History must be a valid value: ', self._histories)
+
+    @property
+    def history_size(self) -> int:
+        """Get number of generations kept by the last-n history"""
+        return self._history_size
+
+    @history_size.setter
+    def history_size(self, history_size: int):
+        """Set number of generations kept by the last-n history"""
+        if history_size >= 1:
+            self._history_size = history_size
+        else:
+            raise ValueError('History size must be at least 1')
+
+    @property
+    def history_path(self) -> str:
+        """Get directory the run history is written to, None when it is not written"""
+        return self._history_path
+
+    @history_path.setter
+    def history_path(self, history_path: str):
+        """Set directory the run history is written to, None to not write it
+
+        The evaluated population of every generation is appended to the
+        directory, whatever the history retention policy, and can be read
+        back with run_history.RunHistory. An execution resumed from a
+        checkpoint goes on appending to the run history already there
+        """
+        self._history_path = None if history_path is None else str(history_path)
+
+    @property
+    def fitness_cache(self) -> bool:
+        """Get whether scores are cached"""
+        return self._fitness_cache
+
+    @fitness_cache.setter
+    def fitness_cache(self, fitness_cache: bool):
+        """Set whether scores are cached
+
+        Scores are never cached for evaluations that are not deterministic
+        """
+        self._fitness_cache = bool(fitness_cache)
+
+    @property
+    def cache_size(self) -> int:
+        """Get maximum number of cached scores"""
+        return self._cache.max_size
+
+    @cache_size.setter
+    def cache_size(self, cache_size: int):
+        """Set maximum number of cached scores"""
+        self._cache.max_size = cache_size
+
+    @property
+    def cache_hits(self) -> int:
+        """Get number of scores served from the cache in the last execution"""
+        return self._cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get number of scores that had to be evaluated in the last execution"""
+        return self._cache.misses
+
+    @property
+    def stopping_criteria(self) -> list:
+        """Get stopping criteria as [type, value] pairs"""
+        return [[criterion.type, criterion.value] for criterion in self._stopping_criteria]
+
+    def add_stopping_criterion(self, criterion_type: str, value) -> None:
+        """Adds a stopping criterion, the execution stops at the first one met
+
+        - target-fitness: the best fitness reaches value
+        - no-improvement: the best fitness does not improve for value generations
+        - low-diversity: the mean standard deviation of the gens falls below value
+        - time-budget: the execution runs for value seconds
+        - evaluation-budget: value chromosomes are evaluated
+        """
+        for name, criterion in self._stopping_criterion_types:
+            if criterion_type == name:
+                self._stopping_criteria.append(criterion(value))
+                return
+
+        raise ValueError(
+            'Stopping criterion type must be a valid value: ',
+            self._stopping_criterion_types
+        )
+
+    def clear_stopping_criteria(self) -> None:
+        """Removes every stopping criterion"""
+        self._stopping_criteria = []
+
+    @property
+    def stop_reason(self) -> str:
+        """Get why the last execution stopped"""
+        return self._stop_reason
+
+    @property
+    def num_generations_run(self) -> int:
+        """Get number of generations run by the last execution"""
+        return self._num_generations_run
+
+    @property
+    def num_evaluations(self) -> int:
+        """Get number of chromosomes evaluated in the last execution"""
+        return self._num_evaluations
+
+    @property
+    def num_delta_evaluations(self) -> int:
+        """Get number of chromosomes evaluated incrementally in the last execution"""
+        return self._num_delta_evaluations
+
+    @property
+    def delta_threshold(self) -> float:
+        """Get fraction of changed gens below which a chromosome is evaluated incrementally"""
+        return self._delta_threshold
+
+    @delta_threshold.setter
+    def delta_threshold(self, delta_threshold: float):
+        """Set fraction of changed gens below which a chromosome is evaluated incrementally
+
+        With evaluations that implement score_delta(), every child is
+        compared with the parent whose place it takes (the first parent for
+        the first child and the second parent for the second child) and,
+        when fewer gens than this fraction changed, its score is updated
+        from the score of the parent instead of being computed from
+        scratch. Finding the changed gens costs a pass over the offspring,
+        so it pays off when scoring a gen is expensive. 0, the default,
+        turns incremental evaluation off
+        """
+        if 0 <= delta_threshold <= 1:
+            self._delta_threshold = delta_threshold
+        else:
+            raise ValueError('Delta threshold must be between 0 and 1')
+
+    @property
+    def elitism(self) -> int:
+        """Get number of fittest individuals copied into the next generation"""
+        return self._elitism
+
+    @elitism.setter
+    def elitism(self, elitism: int):
+        """Set number of fittest individuals copied into the next generation
+
+        They keep their scores, so only the other pop_size - elitism
+        individuals are bred and evaluated every generation
+        """
+        if elitism >= 0:
+            self._elitism = elitism
+        else:
+            raise ValueError('Elitism must be a non negative integer')
+
+    @property
+    def num_offspring(self) -> int:
+        """Get number of children bred every generation"""
+        return self.pop_size - self.elitism
+
+    @property
+    def duplicate_elimination(self) -> bool:
+        """Get whether repeated children are replaced before being evaluated"""
+        return self._duplicate_elimination
+
+    @duplicate_elimination.setter
+    def duplicate_elimination(self, duplicate_elimination: bool):
+        """Set whether repeated children are replaced before being evaluated
+
+        Every child already in the current population, or equal to a
+        previous child, is replaced by a new random chromosome, so the
+        evaluations go to individuals that were not evaluated yet
+        """
+        self._duplicate_elimination = bool(duplicate_elimination)
+
+    @property
+    def num_duplicates(self) -> int:
+        """Get number of repeated children replaced in the last execution"""
+        return self._num_duplicates
+
+    @property
+    def concurrency(self) -> int:
+        """Get maximum number of asynchronous evaluation calls waited on at once"""
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, concurrency: int):
+        """Set maximum number of asynchronous evaluation calls waited on at once"""
+        if concurrency >= 1:
+            self._concurrency = concurrency
+        else:
+            raise ValueError('Concurrency must be at least 1')
+
+    @property
+    def call_timeout(self) -> float:
+        """Get seconds an asynchronous evaluation call may take, None for no limit"""
+        return self._call_timeout
+
+    @call_timeout.setter
+    def call_timeout(self, call_timeout: float):
+        """Set seconds an asynchronous evaluation call may take, None for no limit"""
+        if call_timeout is None or call_timeout > 0:
+            self._call_timeout = call_timeout
+        else:
+            raise ValueError('Call timeout must be greater than 0 or None')
+
+    @property
+    def checkpoint_path(self) -> str:
+        """Get path of the checkpoint file, None when no checkpoint is written"""
+        return self._checkpoint_path
+
+    @checkpoint_path.setter
+    def checkpoint_path(self, checkpoint_path: str):
+        """Set path of the checkpoint file, None to write no checkpoint"""
+        self._checkpoint_path = None if checkpoint_path is None else str(checkpoint_path)
+
+    @property
+    def checkpoint_interval(self) -> int:
+        """Get number of generations between checkpoints"""
+        return self._checkpoint_interval
+
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, checkpoint_interval: int):
+        """Set number of generations between checkpoints"""
+        if checkpoint_interval >= 1:
+            self._checkpoint_interval = checkpoint_interval
+        else:
+            raise ValueError('Checkpoint interval must be at least 1')
+
+    @property
+    def profiling(self) -> bool:
+        """Get whether every generation is profiled"""
+        return self._profiling
+
+    @profiling.setter
+    def profiling(self, profiling: bool):
+        """Set whether every generation is profiled
+
+        The time of every phase, the chromosomes evaluated, the cache hit
+        rate and the peak memory are added to every generation record, to
+        the execution data and, as totals, to the config
+        """
+        self._profiling = bool(profiling)
+
+    @property
+    def metrics_hook(self):
+        """Get function called with the metrics of every profiled generation"""
+        return self._metrics_hook
+
+    @metrics_hook.setter
+    def metrics_hook(self, metrics_hook):
+        """Set function called with the metrics of every profiled generation, or None"""
+        if metrics_hook is None or callable(metrics_hook):
+            self._metrics_hook = metrics_hook
+        else:
+            raise ValueError('Metrics hook must be callable or None')
+
+    @property
+    def metrics(self) -> dict:
+        """Get metrics of the whole last profiled execution, None without profiling"""
+        return self._metrics
+
     @property
     def current_pop(self) -> list:
         """Get current population"""
@@ -204,34 +642,172 @@ class GeneticAlgorithm(Algorithm):
         else:
             raise ValueError('Current population must have individuals')
 
+    def check_operators(self) -> None:
+        """Checks the crossover and the mutation keep the chromosomes of the gen type valid"""
+        for operator in (self._crossover, self._mutation):
+            if self.gen_type not in operator.gen_types:
+                raise ValueError(
+                    f'{operator.type} cannot be used with {self.gen_type} gens, it supports:',
+                    operator.gen_types
+                )
+
     def create_gen(self):
         """Creates a gen according to gen type"""
         return self._gen.create()
 
     def init_pop(self) -> list:
         """Initializes the population"""
-        population = []
-
-        for _ in range(self.pop_size):
-            chromosome = []
-            for _ in range(self.chromo_len):
-                chromosome.append(self.create_gen())
-            population.append(chromosome)
-
+        population = self._gen.create_batch((self.pop_size, self.chromo_len)).tolist()
         evaluated_pop = self.evaluate(population)
         self.current_pop = evaluated_pop
         return evaluated_pop
 
     def evaluate(self, pop: list) -> list:
         """Evaluates the population"""
-        evaluated_pop = []
+        parents, self._parents = self._parents, None
+
+        if parents is not None and self.incremental:
+            return self.evaluate_delta(pop, parents)
+
+        if (self._executor.type == 'serial' and not self._evaluation.vectorized
+                and not self.caching and self._loop is None):
+            evaluated_pop = []
+            self._num_evaluations += len(pop)
 
-        for chromo in pop:
-            evaluated_chromo = self._evaluation.score(chromo, self.expected_solution)
-            evaluated_pop.append(evaluated_chromo)
+            for chromo in pop:
+                evaluated_chromo = self._evaluation.score(chromo, self.expected_solution)
+                evaluated_pop.append(evaluated_chromo)
+
+            return evaluated_pop
+
+        scores = self.score(pop)
+        return [[chromo, score] for chromo, score in zip(pop, scores.tolist())]
+
+    def evaluate_delta(self, pop: list, parents: list) -> list:
+        """Evaluates the offspring incrementally from the scores of their parents
+
+        parents[i] is the evaluated parent child i is compared with
+        """
+        evaluated_pop = [None] * len(pop)
+        max_changed = self._delta_threshold * self.chromo_len
+        full = []
+
+        for i, (chromo, (parent, score)) in enumerate(zip(pop, parents)):
+            indexes = [j for j, (gen, old) in enumerate(zip(chromo, parent)) if gen != old]
+
+            if len(indexes) < max_changed:
+                old_gens = [parent[j] for j in indexes]
+                score = self._evaluation.score_delta(
+                    chromo, score, indexes, old_gens, self.expected_solution
+                )
+                evaluated_pop[i] = [chromo, score]
+            else:
+                full.append(i)
+
+        self._num_evaluations += len(pop) - len(full)
+        self._num_delta_evaluations += len(pop) - len(full)
+
+        if full:
+            scores = self.score([pop[i] for i in full])
+
+            for i, score in zip(full, scores.tolist()):
+                evaluated_pop[i] = [pop[i], score]
 
         return evaluated_pop
 
+    def delta_score(self, chromosomes: np.ndarray, parents: np.ndarray,
+                    parent_fitness: np.ndarray) -> np.ndarray:
+        """Scores a chromosome matrix incrementally from the scores of their parents
+
+        Row i of chromosomes is compared with row i of parents
+        """
+        changed = chromosomes != parents
+        delta = changed.sum(axis=1) < self._delta_threshold * chromosomes.shape[1]
+        fitness = np.empty(len(chromosomes), dtype=np.float64)
+
+        if not delta.all():
+            fitness[~delta] = self.score(chromosomes[~delta])
+
+        rows, columns = np.nonzero(changed[delta])
+        delta_parents = parents[delta]
+        fitness[delta] = self._evaluation.score_delta_batch(
+            chromosomes[delta],
+            parent_fitness[delta],
+            rows,
+            columns,
+            delta_parents[rows, columns],
+            self.expected_solution
+        )
+
+        num_delta = int(delta.sum())
+        self._num_evaluations += num_delta
+        self._num_delta_evaluations += num_delta
+
+        return fitness
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the offspring are evaluated incrementally"""
+        return self._delta_threshold > 0 and self._evaluation.incremental
+
+    @property
+    def caching(self) -> bool:
+        """Whether the scores go through the fitness cache"""
+        return self._fitness_cache and self._evaluation.deterministic
+
+    def score(self, pop):
+        """Scores the population through the fitness cache and the executor"""
+        def score_misses(sub_pop):
+            self._num_evaluations += len(sub_pop)
+
+            # Inside aiter_generations() the scores come from the event loop
+            if self._loop is not None:
+                return asyncio.run_coroutine_threadsafe(self.ascore(sub_pop), self._loop).result()
+
+            return self._executor.score(self._evaluation, sub_pop, self.expected_solution)
+
+        if self.caching:
+            prefix = self.evaluation + self.expected_solution
+            return self._cache.score(pop, prefix, score_misses)
+
+        return score_misses(pop)
+
+    async def ascore(self, pop) -> np.ndarray:
+        """Scores the population concurrently with the asynchronous evaluation
+
+        concurrency workers take the chromosomes one by one, so at most that
+        many ascore() calls are waited on at once. A call that takes longer
+        than call_timeout raises TimeoutError and cancels the others
+        """
+        fitness = np.empty(len(pop), dtype=np.float64)
+        indexes = iter(range(len(pop)))
+
+        async def worker():
+            for i in indexes:
+                try:
+                    evaluated_chromo = await asyncio.wait_for(
+                        self._evaluation.ascore(pop[i], self.expected_solution),
+                        self._call_timeout
+                    )
+                except asyncio.TimeoutError as error:
+                    raise TimeoutError(
+                        f'Evaluation call timed out after {self._call_timeout} seconds'
+                    ) from error
+
+                fitness[i] = evaluated_chromo[1]
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(min(self._concurrency, len(pop)))
+        ]
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        return fitness
+
     def select(self, new_pop: list) -> list:
         """Selects a percentage of the new population for the next generation"""
         return self._selection.select(new_pop, self.pop_size)
@@ -239,53 +815,522 @@ class GeneticAlgorithm(Algorithm):
     def cross(self, sel_pop: list) -> list:
         """Selects random parents according to the selected crossover"""
         offspring = []
+        num_pairs = -(-self.num_offspring // 2)
 
-        for _ in range(self.pop_size):
-            # Gets the chromosome parents from the selected population
-            parent1 = choice(sel_pop)[0]
-            parent2 = choice(sel_pop)[0]
+        # Gets the chromosome parents from the selected population
+        pairs = self._rng.integers(0, len(sel_pop), size=(num_pairs, 2))
 
-            children = self._crossover.cross(self.chromo_len, parent1, parent2)
-            offspring.extend([choice(children)])
+        for parent1, parent2 in pairs.tolist():
+            children = self._crossover.cross(
+                self.chromo_len,
+                sel_pop[parent1][0],
+                sel_pop[parent2][0]
+            )
+            offspring.extend(children)
 
-        return offspring
+        # Every child takes the place of one of its parents for the incremental evaluation
+        if self.incremental:
+            parents = [sel_pop[parent] for pair in pairs.tolist() for parent in pair]
+            self._parents = parents[:self.num_offspring]
+
+        # Drops the second child of the last pair when the number of children is odd
+        return offspring[:self.num_offspring]
 
     def mutate(self, offspring: list) -> list:
         """Mutates the offspring population"""
+        self._mutation.gen = self._gen
         return self._mutation.mutate(offspring, self.chromo_len, self.create_gen)
 
-    def execute(self) -> tuple:
-        """Executes the genetic algorithm"""
-        self.init_pop()
-        current_generation = 1
-        generations = []
-        initial_pops = []
-        selected_pops = []
-        crossover_pops = []
-        mutated_pops = []
-        evaluated_pops = []
-
-        while current_generation <= self.num_generations:
-            selected_pop = self.select(self.current_pop)
-            offspring = self.cross(selected_pop)
-            mutated_offspring = self.mutate(offspring)
-            new_pop = self.evaluate(mutated_offspring)
-
-            generations.append(current_generation)
-            initial_pops.append(self.current_pop)
-            selected_pops.append(selected_pop)
-            crossover_pops.append(offspring)
-            mutated_pops.append(mutated_offspring)
-            evaluated_pops.append(new_pop)
-
-            self.current_pop = new_pop
-            current_generation += 1
+    def elite(self, pop: list) -> list:
+        """Returns the elitism fittest individuals of an evaluated population"""
+        return nlargest(self.elitism, pop, key=itemgetter(1))
+
+    def add_elite(self, pop: list, elite: list) -> list:
+        """Returns the evaluated offspring population with the elite added"""
+        return elite + pop
+
+    def chromosome_key(self, chromo) -> tuple:
+        """Returns the key of a chromosome in the duplicate index"""
+        return tuple(chromo)
+
+    def eliminate_duplicates(self, offspring: list) -> list:
+        """Replaces the repeated children of the offspring population
+
+        A hash index of the current population is built once, so every
+        child is checked in O(1)
+        """
+        index = {self.chromosome_key(chromo) for chromo, _ in self.current_pop}
+        self.replace_duplicates(offspring, index)
+        return offspring
+
+    def replace_duplicates(self, chromosomes, index) -> None:
+        """Replaces in place the chromosomes whose key is in the index or repeated
+
+        Repeated chromosomes are replaced by new random ones, drawing again
+        up to duplicate_retries times while the new one is repeated too
+        (e.g. short binary chromosomes)
+        """
+        seen = set()
+
+        for i in range(len(chromosomes)):
+            key = self.chromosome_key(chromosomes[i])
+
+            if key in index or key in seen:
+                self._num_duplicates += 1
+
+                for _ in range(self.duplicate_retries):
+                    chromosomes[i] = self._gen.create_chromosome(self.chromo_len)
+                    key = self.chromosome_key(chromosomes[i])
+
+                    if key not in index and key not in seen:
+                        break
+
+            seen.add(key)
+
+    def summarize(self, pop: list) -> dict:
+        """Summarizes the fitness of an evaluated population"""
+        best_chromo, best_score = max(pop, key=lambda x: x[1])
+        mean_score = sum(score for _, score in pop) / len(pop)
+
+        return {
+            "Best fitness": best_score,
+            "Mean fitness": mean_score,
+            "Best chromosome": best_chromo,
+        }
+
+    def diversity(self) -> float:
+        """Returns the mean standard deviation of the gens of the current population"""
+        chromosomes = np.array([chromo for chromo, _ in self.current_pop], dtype=np.float64)
+        return float(chromosomes.std(axis=0).mean())
+
+    def check_stop(self, record: dict) -> str:
+        """Returns the reason of the first stopping criterion met, if any"""
+        for criterion in self._stopping_criteria:
+            reason = criterion.check(self, record)
+
+            if reason is not None:
+                return reason
+
+        return None
+
+    def snapshot(self, pop: list) -> list:
+        """Returns an independent copy of a population"""
+        return deepcopy(pop)
+
+    def best(self, num_best: int) -> list:
+        """Returns copies of the fittest individuals of the current population
+
+        I.E.
+        Output: [[chromosome, score], ...]
+        """
+        return deepcopy(nlargest(num_best, self.current_pop, key=itemgetter(1)))
+
+    def immigrate(self, immigrants: list) -> None:
+        """Replaces the worst individuals of the current population
+
+        The fittest immigrants, given as [[chromosome, score], ...], take the
+        place of the same number of the worst individuals
+        """
+        pop = self.current_pop
+        immigrants = nlargest(len(pop), immigrants, key=itemgetter(1))
+        worst = nsmallest(len(immigrants), range(len(pop)), key=lambda i: pop[i][1])
+
+        for i, (chromo, score) in zip(worst, immigrants):
+            pop[i] = [list(chromo), score]
+
+    def population_arrays(self, pop: list) -> tuple:
+        """Returns new chromosome matrix and fitness vector arrays of a population"""
+        chromosomes = np.array([chromo for chromo, _ in pop], dtype=self._gen.dtype)
+        fitness = np.array([score for _, score in pop], dtype=np.float64)
+        return chromosomes, fitness
+
+    def population_from_arrays(self, chromosomes: np.ndarray, fitness: np.ndarray) -> list:
+        """Returns the population given by a chromosome matrix and a fitness vector"""
+        return [[chromo, score] for chromo, score in zip(chromosomes.tolist(), fitness.tolist())]
+
+    def checkpoint_state(self) -> dict:
+        """Returns the arrays of a checkpoint of the current state
+
+        The state holds the current population, the number of generations
+        run, the state of every random number generator and the
+        configuration of the algorithm and its operators
+        """
+        chromosomes, fitness = self.population_arrays(self.current_pop)
+        packed_bits = chromosomes.dtype == np.bool_
+
+        # Binary gens take one bit each on disk
+        if packed_bits:
+            chromosomes = np.packbits(chromosomes, axis=1)
+
+        seed_sequence = self._seed_sequence
+        state = {
+            "version": 1,
+            "packed_bits": bool(packed_bits),
+            "algorithm": self.name,
+            "generation": self._num_generations_run,
+            "evaluations": self._num_evaluations,
+            "evaluation": self.evaluation,
+            "expected_solution": self.expected_solution,
+            "chromo_len": self.chromo_len,
+            "pop_size": self.pop_size,
+            "num_generations": self.num_generations,
+            "elitism": self.elitism,
+            "duplicate_elimination": self.duplicate_elimination,
+            "stopping_criteria": self.stopping_criteria,
+            "seed": self.seed,
+            "seed_sequence": {
+                "entropy": seed_sequence.entropy,
+                "spawn_key": list(seed_sequence.spawn_key),
+                "n_children_spawned": seed_sequence.n_children_spawned,
+            },
+            "rng": self._rng.bit_generator.state,
+            "gen": operator_state(self._gen),
+            "selection": operator_state(self._selection),
+            "crossover": operator_state(self._crossover),
+            "mutation": operator_state(self._mutation),
+            "engine": self.engine_state(),
+        }
+
+        return {
+            "chromosomes": chromosomes,
+            "fitness": fitness,
+            "state": np.array(json.dumps(state)),
+        }
+
+    def engine_state(self) -> dict:
+        """Returns the settings of the engine saved in checkpoints besides the common ones"""
+        return {}
+
+    def restore_engine_state(self, state: dict) -> None:
+        """Restores the settings returned by engine_state()"""
+
+    def checkpoint(self, path: str) -> None:
+        """Writes a checkpoint of the current state"""
+        save_checkpoint(path, self.checkpoint_state())
+
+    def resume_from(self, path: str) -> None:
+        """Restores the state of a checkpoint
+
+        The next execution goes on from the generation after the one of the
+        checkpoint instead of initializing a new population, and produces
+        the same generations the checkpointed execution would have. The
+        number of generations may be raised afterwards to run longer.
+        Stopping criteria start over, and the executor, history and
+        checkpoint settings are kept as they are.
+        """
+        arrays = load_checkpoint(path)
+        state = json.loads(str(arrays["state"]))
+
+        if state["algorithm"] != self.name:
+            raise ValueError('Checkpoint was written by', state["algorithm"])
+
+        self.evaluation = state["evaluation"]
+        self.expected_solution = state["expected_solution"]
+        self.chromo_len = state["chromo_len"]
+        self.pop_size = state["pop_size"]
+        self.num_generations = state["num_generations"]
+        # Checkpoints written before elitism and duplicate elimination had neither
+        self.elitism = state.get("elitism", 0)
+        self.duplicate_elimination = state.get("duplicate_elimination", False)
+        self.restore_engine_state(state.get("engine", {}))
+        self.gen_type = state["gen"]["type"]
+        self.selection_type = state["selection"]["type"]
+        self.crossover_type = state["crossover"]["type"]
+        self.mutation_type = state["mutation"]["type"]
+
+        self.clear_stopping_criteria()
+        for criterion_type, value in state["stopping_criteria"]:
+            self.add_stopping_criterion(criterion_type, value)
+
+        # The operators are set first since setting them spawns new streams
+        self._seed = state["seed"]
+        self._seed_sequence = np.random.SeedSequence(
+            state["seed_sequence"]["entropy"],
+            spawn_key=tuple(state["seed_sequence"]["spawn_key"]),
+            n_children_spawned=state["seed_sequence"]["n_children_spawned"],
+        )
+        self._rng.bit_generator.state = state["rng"]
+        restore_operator(self._gen, state["gen"])
+        restore_operator(self._selection, state["selection"])
+        restore_operator(self._crossover, state["crossover"])
+        restore_operator(self._mutation, state["mutation"])
+
+        chromosomes = arrays["chromosomes"]
+
+        if state["packed_bits"]:
+            chromosomes = np.unpackbits(chromosomes, axis=1, count=self.chromo_len).astype(np.bool_)
+
+        self.current_pop = self.population_from_arrays(chromosomes, arrays["fitness"])
+        self._num_generations_run = state["generation"]
+        self._num_evaluations = state["evaluations"]
+        self._num_delta_evaluations = 0
+        self._resume_generation = state["generation"]
+
+    def generation(self, record: dict, snapshots: bool, profiler: Profiler):
+        """Breeds and evaluates the next generation from the current population
+
+        With snapshots, the selected, crossover and mutated populations
+        are added to the record. Returns the new evaluated population
+        """
+        elite = self.elite(self.current_pop)
+        selected_pop = self.select(self.current_pop)
+
+        if profiler is not None:
+            profiler.lap('select')
+
+        offspring = self.cross(selected_pop)
+
+        if profiler is not None:
+            profiler.lap('cross')
+
+        if snapshots:
+            record["Selected population"] = self.snapshot(selected_pop)
+            record["Crossover population"] = self.snapshot(offspring)
+
+            if profiler is not None:
+                profiler.restart()
+
+        mutated_offspring = self.mutate(offspring)
+
+        if self.duplicate_elimination:
+            mutated_offspring = self.eliminate_duplicates(mutated_offspring)
+
+        if profiler is not None:
+            profiler.lap('mutate')
+
+        new_pop = self.evaluate(mutated_offspring)
+
+        if profiler is not None:
+            profiler.lap('evaluate')
+
+        if snapshots:
+            record["Mutated population"] = self.snapshot(mutated_offspring)
+
+            if profiler is not None:
+                profiler.restart()
+
+        return self.add_elite(new_pop, elite)
+
+    def iter_generations(self, snapshots: bool = False):
+        """Executes the genetic algorithm yielding one record per generation
+
+        Every record holds the generation number, its fitness summary and
+        the evaluated population. Nothing is kept once the record is
+        consumed, so memory stays flat.
+
+        The evaluated population is the working population: later
+        generations may reuse its storage, so it must be copied with
+        snapshot() if it has to outlive the next record. With snapshots,
+        the record also holds the initial, selected, crossover and mutated
+        populations, each one copied right after its step.
+
+        The execution stops after num_generations generations or as soon as
+        a stopping criterion is met, see stop_reason.
+
+        With a checkpoint path, a checkpoint is written in the background
+        every checkpoint_interval generations and after the last one. After
+        resume_from(), the execution goes on from the checkpoint.
+
+        With profiling, the record also holds the metrics of the generation,
+        see Profiler.metrics().
+        """
+        self.check_operators()
+
+        if self.elitism >= self.pop_size:
+            raise ValueError('Elitism must be lower than the population size', self.elitism)
+
+        resume_generation, self._resume_generation = self._resume_generation, None
+        self._stop_reason = None
+
+        if resume_generation is None:
+            self._num_generations_run = 0
+            self._num_evaluations = 0
+            self._num_delta_evaluations = 0
+            self._num_duplicates = 0
+            self._cache.reset_counters()
+
+        for criterion in self._stopping_criteria:
+            criterion.reset()
+
+        writer = CheckpointWriter() if self.checkpoint_path is not None else None
+        profiler = Profiler(self) if self.profiling else None
+        self._metrics = None
+
+        try:
+            if resume_generation is None:
+                self.init_pop()
+                current_generation = 1
+
+                if profiler is not None:
+                    profiler.lap('init')
+            else:
+                current_generation = resume_generation + 1
+
+            self._stop_reason = 'num-generations'
+
+            while current_generation <= self.num_generations:
+                record = {"Generation": current_generation}
+
+                if snapshots:
+                    record["Initial population"] = self.snapshot(self.current_pop)
+
+                if profiler is not None:
+                    profiler.start()
+
+                new_pop = self.generation(record, snapshots, profiler)
+                self.current_pop = new_pop
+                record.update(self.summarize(new_pop))
+
+                if snapshots:
+                    record["Evaluated population"] = self.snapshot(new_pop)
+                else:
+                    record["Evaluated population"] = new_pop
+
+                self._num_generations_run = current_generation
+
+                if profiler is not None:
+                    metrics = profiler.metrics()
+                    record.update(metrics)
+
+                    if self.metrics_hook is not None:
+                        self.metrics_hook({"Generation": current_generation, **metrics})
+
+                reason = self.check_stop(record)
+
+                if writer is not None and (
+                        current_generation % self.checkpoint_interval == 0
+                        or current_generation == self.num_generations
+                        or reason is not None):
+                    writer.write(self.checkpoint_path, self.checkpoint_state())
+
+                yield record
+
+                if reason is not None:
+                    self._stop_reason = reason
+                    break
+
+                current_generation += 1
+        finally:
+            self._executor.release()
+
+            if writer is not None:
+                writer.close()
+
+            if profiler is not None:
+                self._metrics = profiler.totals()
+
+    async def aiter_generations(self, snapshots: bool = False):
+        """Asynchronous version of iter_generations()
+
+        The generations run in a worker thread, so the event loop is free
+        while they breed, and every population is scored on the event loop
+        with ascore(). Everything else (stopping criteria, fitness cache,
+        checkpoints, profiling) works as in iter_generations()
+        """
+        loop = asyncio.get_running_loop()
+        generations = self.iter_generations(snapshots)
+
+        try:
+            while True:
+                # Only set while a generation runs, the consumer may stop between them
+                self._loop = loop
+
+                try:
+                    record = await asyncio.to_thread(next, generations, None)
+                finally:
+                    self._loop = None
+
+                if record is None:
+                    return
+
+                yield record
+        finally:
+            await asyncio.to_thread(generations.close)
+
+    async def aexecute(self, on_generation=None) -> tuple:
+        """Asynchronous version of execute()
+
+        Every population is scored concurrently with ascore(), see
+        aiter_generations(). on_generation(record) is called from the
+        worker thread the generations run in
+        """
+        self._loop = asyncio.get_running_loop()
+
+        try:
+            return await asyncio.to_thread(self.execute, on_generation)
+        finally:
+            self._loop = None
+
+    def execute(self, on_generation=None) -> tuple:
+        """Executes the genetic algorithm
+
+        The returned execution data depends on the history retention policy.
+        on_generation(record), if given, is called with every generation
+        record as soon as it is produced
+        """
+        summary_columns = ["Generation", "Best fitness", "Mean fitness", "Best chromosome"]
+
+        if self.profiling:
+            summary_columns += [
+                "Select time",
+                "Cross time",
+                "Mutate time",
+                "Evaluate time",
+                "Generation time",
+                "Evaluations",
+                "Cache hit rate",
+                "Peak memory (MB)",
+            ]
+
+        pop_columns = [
+            "Initial population",
+            "Selected population",
+            "Crossover population",
+            "Mutated population",
+            "Evaluated population",
+        ]
+        columns = []
+
+        if self.history == 'summary':
+            columns = summary_columns
+        elif self.history in ('last-n', 'full'):
+            columns = summary_columns + pop_columns
+
+        maxlen = self.history_size if self.history == 'last-n' else None
+        records = deque(maxlen=maxlen)
+
+        snapshots = self.history in ('last-n', 'full')
+        writer = RunHistoryWriter(self.history_path) if self.history_path is not None else None
+
+        try:
+            for record in self.iter_generations(snapshots):
+                if writer is not None:
+                    writer.append(
+                        record["Generation"],
+                        *self.population_arrays(record["Evaluated population"])
+                    )
+
+                if on_generation is not None:
+                    on_generation(record)
+
+                if columns:
+                    records.append([record[column] for column in columns])
+        finally:
+            if writer is not None:
+                writer.close()
 
         config = {
             "Evaluation type": [self.evaluation],
             "Expected solution": [self.expected_solution],
             "Algorithm": [self.name],
             "Generations": [self.num_generations],
+            "Generations run": [self.num_generations_run],
+            "Stop reason": [self.stop_reason],
+            "Evaluations": [self.num_evaluations],
+            "Delta evaluations": [self.num_delta_evaluations],
+            "Elitism": [self.elitism],
+            "Duplicate elimination": [self.duplicate_elimination],
+            "Duplicates replaced": [self.num_duplicates],
             "Population size": [self.pop_size],
             "Chromosome length": [self.chromo_len],
             "Gen type": [self.gen_type],
@@ -294,14 +1339,24 @@ class GeneticAlgorithm(Algorithm):
             "Crossover type": [self.crossover_type],
             "Mutation type": [self.mutation_type],
             "Mutation rate": [self.mutation_rate],
+            "Executor type": [self.executor_type],
+            "Workers": [self.workers],
+            "History": [self.history],
+            "History path": [self.history_path],
+            "Seed": [self.seed],
+            "Fitness cache": [self.caching],
+            "Cache hits": [self.cache_hits],
+            "Cache misses": [self.cache_misses],
+            "Checkpoint": [self.checkpoint_path],
+            "Profiling": [self.profiling],
         }
+
+        if self.metrics is not None:
+            config.update({name: [value] for name, value in self.metrics.items()})
+
         exec_data = {
-            "Generation": generations,
-            "Initial population": initial_pops,
-            "Selected population": selected_pops,
-            "Crossover population": crossover_pops,
-            "Mutated population": mutated_pops,
-            "Evaluated population": evaluated_pops,
+            column: [record[i] for record in records]
+            for i, column in enumerate(columns)
         }
 
         return config, exec_data
@@ -0,0 +1,254 @@
+"""This file is for defining the island model"""
+import multiprocessing
+import traceback
+from copy import deepcopy
+
+import numpy as np
+
+def run_island(index: int, ga, targets: list, num_sources: int, migration_interval: int,
+               migration_size: int, inboxes: list, results) -> None:
+    """Runs one island inside its own process
+
+    Every migration_interval generations the island sends copies of its
+    migration_size fittest individuals to the inboxes of its targets and
+    waits for the migrants of its num_sources sources, which replace its
+    worst individuals. An island that stops, e.g. because of a stopping
+    criterion, tells its targets so they do not wait for it anymore
+    """
+    pending = {}
+    finished = set()
+
+    def migrate(record: dict) -> None:
+        generation = record["Generation"]
+
+        if generation % migration_interval or generation == ga.num_generations:
+            return
+
+        migrants = ga.best(migration_size)
+        for target in targets:
+            inboxes[target].put((generation, index, migrants))
+
+        # Migrants of a later migration may arrive before the current ones
+        while len(finished.union(pending.get(generation, {}))) < num_sources:
+            migration, source, immigrants = inboxes[index].get()
+
+            if migration is None:
+                finished.add(source)
+            else:
+                pending.setdefault(migration, {})[source] = immigrants
+
+        # Immigrants are taken in source order so seeded runs are reproducible
+        arrived = pending.pop(generation, {})
+        ga.immigrate([immigrant for source in sorted(arrived) for immigrant in arrived[source]])
+
+    try:
+        config, exec_data = ga.execute(on_generation=migrate if num_sources else None)
+        results.put((index, config, exec_data, None))
+    except Exception:  # pylint: disable=broad-except
+        results.put((index, None, None, traceback.format_exc()))
+    finally:
+        for target in targets:
+            inboxes[target].put((None, index, None))
+
+class IslandModel:
+    """Island model class
+
+    Runs several genetic algorithms (islands) in separate processes. Every
+    migration_interval generations, each island sends its migration_size
+    fittest individuals to its neighbours, where they replace the worst
+    individuals. Every island keeps its own configuration.
+
+    Configurable attributes:
+    - topology
+    - migration interval
+    - migration size
+    - seed
+    """
+    def __init__(self, islands: list) -> None:
+        if not islands:
+            raise ValueError('Island model must have islands')
+
+        self._name = 'island-model'
+        self._islands = islands
+        self._topologies = ['ring', 'fully-connected']
+        self._topology = 'ring'
+        self._migration_interval = 5
+        self._migration_size = 1
+        self._seed = None
+
+    @classmethod
+    def from_algorithm(cls, ga, num_islands: int) -> 'IslandModel':
+        """Creates an island model with num_islands copies of a genetic algorithm"""
+        return cls([deepcopy(ga) for _ in range(num_islands)])
+
+    @property
+    def name(self) -> str:
+        """Get algorithm name"""
+        return self._name
+
+    @property
+    def islands(self) -> list:
+        """Get islands"""
+        return self._islands
+
+    @property
+    def topology(self) -> str:
+        """Get migration topology"""
+        return self._topology
+
+    @topology.setter
+    def topology(self, topology: str):
+        """Set migration topology
+
+        - ring: every island sends its migrants to the next island
+        - fully-connected: every island sends its migrants to every other island
+        """
+        if topology in self._topologies:
+            self._topology = topology
+        else:
+            raise ValueError('Topology must be a valid value: ', self._topologies)
+
+    @property
+    def migration_interval(self) -> int:
+        """Get number of generations between migrations"""
+        return self._migration_interval
+
+    @migration_interval.setter
+    def migration_interval(self, migration_interval: int):
+        """Set number of generations between migrations"""
+        if migration_interval >= 1:
+            self._migration_interval = migration_interval
+        else:
+            raise ValueError('Migration interval must be at least 1')
+
+    @property
+    def migration_size(self) -> int:
+        """Get number of individuals sent by every island on every migration"""
+        return self._migration_size
+
+    @migration_size.setter
+    def migration_size(self, migration_size: int):
+        """Set number of individuals sent by every island on every migration"""
+        if migration_size >= 1:
+            self._migration_size = migration_size
+        else:
+            raise ValueError('Migration size must be at least 1')
+
+    @property
+    def seed(self) -> int:
+        """Get seed of the islands"""
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: int):
+        """Set seed of the islands
+
+        Every island is seeded from its own independent stream of the seed,
+        None seeds the islands from fresh OS entropy on every execution
+        """
+        self.seed_islands(seed)
+        self._seed = seed
+
+    def seed_islands(self, seed: int) -> None:
+        """Seeds every island from its own independent stream of a seed"""
+        seeds = np.random.SeedSequence(seed).spawn(len(self._islands))
+
+        for ga, island_seed in zip(self._islands, seeds):
+            ga.seed = int(island_seed.generate_state(1)[0])
+
+    def targets(self, index: int) -> list:
+        """Returns the islands receiving the migrants of an island"""
+        num_islands = len(self._islands)
+
+        if num_islands == 1:
+            return []
+
+        if self._topology == 'ring':
+            return [(index + 1) % num_islands]
+
+        return [target for target in range(num_islands) if target != index]
+
+    def execute(self) -> tuple:
+        """Executes every island and merges their results
+
+        The config and execution data have the same shape as the ones
+        returned by GeneticAlgorithm.execute(), with one config row per
+        island and an Island column telling where every row comes from
+        """
+        num_generations = {ga.num_generations for ga in self._islands}
+
+        if len(num_generations) != 1:
+            raise ValueError('Every island must have the same number of generations')
+
+        # Copies of one algorithm share its random state and would run the same search
+        if self._seed is None:
+            self.seed_islands(None)
+
+        num_islands = len(self._islands)
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(num_islands)]
+        results = context.Queue()
+        num_sources = len(self.targets(0))
+        processes = [
+            context.Process(
+                target=run_island,
+                args=(index, ga, self.targets(index), num_sources, self._migration_interval,
+                      self._migration_size, inboxes, results)
+            )
+            for index, ga in enumerate(self._islands)
+        ]
+
+        for process in processes:
+            process.start()
+
+        island_results = [None] * num_islands
+
+        try:
+            for _ in range(num_islands):
+                index, config, exec_data, error = results.get()
+
+                if error is not None:
+                    raise RuntimeError(f'Island {index} failed:\n{error}')
+
+                island_results[index] = (config, exec_data)
+        finally:
+            failed = any(result is None for result in island_results)
+
+            for process in processes:
+                if failed:
+                    process.terminate()
+                process.join()
+
+        return self.merge(island_results)
+
+    def merge(self, island_results: list) -> tuple:
+        """Merges the config and execution data of every island"""
+        configs = []
+        exec_datas = []
+
+        for index, (config, exec_data) in enumerate(island_results):
+            num_rows = len(next(iter(exec_data.values()), []))
+            configs.append({
+                "Island": [index],
+                "Topology": [self._topology],
+                "Migration interval": [self._migration_interval],
+                "Migration size": [self._migration_size],
+                **config,
+            })
+            exec_datas.append({"Island": [index] * num_rows, **exec_data})
+
+        return self.concat(configs), self.concat(exec_datas)
+
+    @staticmethod
+    def concat(tables: list) -> dict:
+        """Concatenates the rows of tables given as {column: values}"""
+        columns = list(dict.fromkeys(column for table in tables for column in table))
+        merged = {column: [] for column in columns}
+
+        for table in tables:
+            num_rows = len(next(iter(table.values()), []))
+
+            for column in columns:
+                merged[column].extend(table.get(column, [None] * num_rows))
+
+        return merged
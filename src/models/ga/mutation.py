@@ -1,17 +1,48 @@
 """This file is for defining the mutation class and its child classes"""
-from random import random
+import numpy as np
 
 class Mutation:
     """Mutation class"""
+    # Below this rate the mutation sites are sampled by geometric skipping
+    skip_rate = 0.1
+    # Gen types whose chromosomes stay valid after the mutation
+    gen_types = ('real-number', 'integer', 'binary')
+
     def __init__(self, rate: float):
         self._type = 'Mutation'
         self._rate = rate
+        self._rng = np.random.default_rng()
+        self._gen = None
 
     @property
     def type(self) -> str:
         """Get mutation type"""
         return self._type
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Get random number generator"""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        """Set random number generator"""
+        self._rng = rng
+
+    @property
+    def gen(self):
+        """Get gen type create_gen() draws from, None when it is not known"""
+        return self._gen
+
+    @gen.setter
+    def gen(self, gen) -> None:
+        """Set gen type create_gen() draws from
+
+        Lets the mutation draw new gens in bulk and keep them within the
+        gen range
+        """
+        self._gen = gen
+
     @property
     def rate(self) -> float:
         """Get mutation rate"""
@@ -26,9 +57,48 @@ class Mutation:
             raise ValueError('Mutation rate must be between 0 and 1')
 
     def mutate(self, offspring: list, chromo_len: int, create_gen) -> list:
-        """Mutation method"""
+        """Mutation method
+
+        Mutates the offspring chromosomes in place, create_gen() creates a
+        new gen
+        """
         raise NotImplementedError('Mutation method should be implemented by child class')
 
+    def mutate_batch(self, offspring: np.ndarray, gen) -> np.ndarray:
+        """Mutates the offspring matrix in place
+
+        Falls back to calling mutate() over the rows of the matrix
+        """
+        self.gen = gen
+        self.mutate(offspring, offspring.shape[1], gen.create)
+        return offspring
+
+    def mutation_sites(self, size: int) -> np.ndarray:
+        """Draws the flat indexes of the gens to mutate out of size gens
+
+        Every gen is mutated with probability rate. With high rates a
+        Bernoulli mask is drawn. With low rates, the gaps between mutation
+        sites are drawn from a geometric distribution instead, so the cost
+        depends on the number of mutations and not on the number of gens
+        """
+        if self._rate == 0 or size == 0:
+            return np.empty(0, dtype=np.intp)
+
+        if self._rate >= self.skip_rate:
+            return np.flatnonzero(self._rng.random(size) < self._rate)
+
+        chunks = []
+        last_site = -1
+
+        while last_site < size:
+            expected = int((size - last_site) * self._rate * 1.1) + 16
+            sites = last_site + np.cumsum(self._rng.geometric(self._rate, size=expected))
+            chunks.append(sites)
+            last_site = sites[-1]
+
+        sites = np.concatenate(chunks)
+        return sites[:np.searchsorted(sites, size)]
+
 class RandomResetting(Mutation):
     """Random resetting class
 
@@ -39,11 +109,125 @@ class RandomResetting(Mutation):
         self._type = 'random-resetting'
 
     def mutate(self, offspring: list, chromo_len: int, create_gen) -> list:
-        mutated_offspring = []
-        for child in offspring:
-            for i in range(chromo_len):
-                if self._rate > random():
-                    child[i] = create_gen()
-            mutated_offspring.append(child)
-
-        return mutated_offspring
+        sites = self.mutation_sites(len(offspring) * chromo_len)
+
+        if self._gen is not None:
+            new_gens = self._gen.create_batch(len(sites)).tolist()
+        else:
+            new_gens = [create_gen() for _ in range(len(sites))]
+
+        for site, new_gen in zip(sites.tolist(), new_gens):
+            offspring[site // chromo_len][site % chromo_len] = new_gen
+
+        return list(offspring)
+
+    def mutate_batch(self, offspring: np.ndarray, gen) -> np.ndarray:
+        sites = self.mutation_sites(offspring.size)
+        offspring.put(sites, gen.create_batch(len(sites)))
+
+        return offspring
+
+class Gaussian(Mutation):
+    """Gaussian (creep) mutation class
+
+    Adds a small normally distributed step to the mutated gens, so they
+    move around their current value instead of being reset. The gens are
+    kept within the gen range when the gen has one, and integer gens are
+    rounded to the nearest integer
+    """
+    gen_types = ('real-number', 'integer')
+
+    def __init__(self, rate: float):
+        super().__init__(rate)
+        self._type = 'gaussian'
+        self._sigma = 1.0
+
+    @property
+    def sigma(self) -> float:
+        """Get standard deviation of the mutation step"""
+        return self._sigma
+
+    @sigma.setter
+    def sigma(self, sigma: float) -> None:
+        """Set standard deviation of the mutation step"""
+        if sigma > 0:
+            self._sigma = sigma
+        else:
+            raise ValueError('Sigma must be greater than 0')
+
+    def mutate(self, offspring: list, chromo_len: int, create_gen) -> list:
+        sites = self.mutation_sites(len(offspring) * chromo_len)
+        steps = self._rng.normal(0, self._sigma, size=len(sites))
+        min_value = getattr(self._gen, 'min_value', -np.inf)
+        max_value = getattr(self._gen, 'max_value', np.inf)
+
+        for site, step in zip(sites.tolist(), steps.tolist()):
+            chromo, index = offspring[site // chromo_len], site % chromo_len
+            value = min(max(chromo[index] + step, min_value), max_value)
+
+            if isinstance(chromo[index], int):
+                chromo[index] = round(value)
+            else:
+                chromo[index] = value
+
+        return list(offspring)
+
+    def mutate_batch(self, offspring: np.ndarray, gen) -> np.ndarray:
+        sites = self.mutation_sites(offspring.size)
+        genes = offspring.take(sites) + self._rng.normal(0, self._sigma, size=len(sites))
+
+        if hasattr(gen, 'min_value') and hasattr(gen, 'max_value'):
+            np.clip(genes, gen.min_value, gen.max_value, out=genes)
+
+        if offspring.dtype.kind in 'iu':
+            np.rint(genes, out=genes)
+
+        offspring.put(sites, genes)
+
+        return offspring
+
+class Swap(Mutation):
+    """Swap mutation class
+
+    Swaps every mutated gen with a random gen of the same chromosome, so
+    the chromosomes keep their gens, e.g. permutations stay permutations
+    """
+    gen_types = ('real-number', 'integer', 'binary', 'permutation')
+
+    def __init__(self, rate: float):
+        super().__init__(rate)
+        self._type = 'swap'
+
+    def mutate(self, offspring: list, chromo_len: int, create_gen) -> list:
+        sites = self.mutation_sites(len(offspring) * chromo_len)
+        others = self._rng.integers(0, chromo_len, size=len(sites))
+
+        for site, other in zip(sites.tolist(), others.tolist()):
+            chromo, index = offspring[site // chromo_len], site % chromo_len
+            chromo[index], chromo[other] = chromo[other], chromo[index]
+
+        return list(offspring)
+
+    def mutate_batch(self, offspring: np.ndarray, gen) -> np.ndarray:
+        chromo_len = offspring.shape[1]
+        sites = self.mutation_sites(offspring.size)
+        others = self._rng.integers(0, chromo_len, size=len(sites))
+        rows, columns = np.divmod(sites, chromo_len)
+
+        # Swaps of the same chromosome are applied in rounds, one per chromosome
+        # and round, in the same order as mutate(). The sites are sorted, so the
+        # round of a swap is its rank among the swaps of its chromosome
+        rounds = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        order = np.argsort(rounds, kind='stable')
+        ends = np.cumsum(np.bincount(rounds))
+        start = 0
+
+        for end in ends:
+            swaps = order[start:end]
+            swap_rows, swap_columns, swap_others = rows[swaps], columns[swaps], others[swaps]
+            offspring[swap_rows, swap_columns], offspring[swap_rows, swap_others] = (
+                offspring[swap_rows, swap_others], offspring[swap_rows, swap_columns]
+            )
+            start = end
+
+        return offspring
@@ -0,0 +1,60 @@
+"""This file is for defining the array backed population"""
+import numpy as np
+
+class Population:
+    """Population class
+
+    Holds the chromosomes as a (pop_size, chromo_len) matrix and,
+    once evaluated, their fitness as a vector
+    """
+    def __init__(self, chromosomes: np.ndarray, fitness: np.ndarray = None) -> None:
+        self._chromosomes = chromosomes
+        self._fitness = fitness
+
+    @property
+    def chromosomes(self) -> np.ndarray:
+        """Get chromosomes matrix"""
+        return self._chromosomes
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """Get fitness vector"""
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, fitness: np.ndarray) -> None:
+        """Set fitness vector"""
+        if len(fitness) != len(self._chromosomes):
+            raise ValueError('Fitness must have one score per chromosome')
+
+        self._fitness = fitness
+
+    def __len__(self) -> int:
+        return len(self._chromosomes)
+
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+
+    def copy(self) -> 'Population':
+        """Returns an independent copy of the population"""
+        fitness = None if self._fitness is None else self._fitness.copy()
+        return Population(self._chromosomes.copy(), fitness)
+
+    def take(self, indexes: np.ndarray) -> 'Population':
+        """Returns a new population with the chromosomes at the given indexes"""
+        fitness = None if self._fitness is None else self._fitness[indexes]
+        return Population(self._chromosomes[indexes], fitness)
+
+    def to_list(self) -> list:
+        """Converts the population to the list layout used by GeneticAlgorithm
+
+        I.E.
+        Evaluated: [[chromosome, score], ...]
+        Not evaluated: [chromosome, ...]
+        """
+        chromosomes = self._chromosomes.tolist()
+
+        if self._fitness is None:
+            return chromosomes
+
+        return [list(pair) for pair in zip(chromosomes, self._fitness.tolist())]
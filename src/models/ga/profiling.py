@@ -0,0 +1,97 @@
+"""This file is for defining the profiler of the genetic algorithm"""
+import sys
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+def peak_memory() -> float:
+    """Returns the peak resident memory of the process in MB, None if unknown"""
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return max_rss / 2 ** 20
+
+    return max_rss / 2 ** 10
+
+class Profiler:
+    """Profiler class
+
+    Measures the wall time of every phase of a generation (select, cross,
+    mutate, evaluate), the chromosomes evaluated, the cache hit rate and
+    the peak memory. It is only created when profiling is on, so an
+    execution without profiling pays nothing but a few None checks
+    """
+    phases = ('init', 'select', 'cross', 'mutate', 'evaluate')
+
+    def __init__(self, ga) -> None:
+        self._ga = ga
+        self._totals = dict.fromkeys(self.phases, 0.0)
+        self._times = {}
+        self._start = perf_counter()
+        self._last = self._start
+        self._generation_start = self._start
+        self._evaluations = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._start_cache_hits = ga.cache_hits
+        self._start_cache_misses = ga.cache_misses
+
+    def start(self) -> None:
+        """Starts timing a generation"""
+        self._times = {}
+        self._evaluations = self._ga.num_evaluations
+        self._cache_hits = self._ga.cache_hits
+        self._cache_misses = self._ga.cache_misses
+        self._last = self._generation_start = perf_counter()
+
+    def restart(self) -> None:
+        """Leaves the time since the last phase out of every phase"""
+        self._last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Ends timing a phase"""
+        now = perf_counter()
+        self._times[phase] = self._times.get(phase, 0.0) + now - self._last
+        self._totals[phase] += now - self._last
+        self._last = now
+
+    def metrics(self) -> dict:
+        """Returns the metrics of the generation timed last"""
+        ga = self._ga
+        hits = ga.cache_hits - self._cache_hits
+        misses = ga.cache_misses - self._cache_misses
+        evaluations = ga.num_evaluations - self._evaluations
+
+        return {
+            "Select time": self._times.get('select', 0.0),
+            "Cross time": self._times.get('cross', 0.0),
+            "Mutate time": self._times.get('mutate', 0.0),
+            "Evaluate time": self._times.get('evaluate', 0.0),
+            "Generation time": perf_counter() - self._generation_start,
+            "Evaluations": evaluations,
+            "Cache hit rate": hits / (hits + misses) if ga.caching and hits + misses else None,
+            "Peak memory (MB)": peak_memory(),
+        }
+
+    def totals(self) -> dict:
+        """Returns the metrics of the whole execution"""
+        hits = self._ga.cache_hits - self._start_cache_hits
+        misses = self._ga.cache_misses - self._start_cache_misses
+
+        return {
+            "Init time": self._totals['init'],
+            "Select time": self._totals['select'],
+            "Cross time": self._totals['cross'],
+            "Mutate time": self._totals['mutate'],
+            "Evaluate time": self._totals['evaluate'],
+            "Total time": perf_counter() - self._start,
+            "Cache hit rate": hits / (hits + misses) if self._ga.caching and hits + misses else None,
+            "Peak memory (MB)": peak_memory(),
+        }
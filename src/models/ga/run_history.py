@@ -0,0 +1,246 @@
+"""This file is for defining the on-disk run history
+
+A run history is a directory with the evaluated population of every
+generation stored column by column in chunked .npy files:
+- chromosomes-NNNNN.npy: (chunk_size, pop_size, chromo_len) chromosomes
+- fitness-NNNNN.npy: (chunk_size, pop_size) fitness
+- run.json: shapes, dtypes and the generations written so far
+
+Only the evaluated population is kept: the selected, crossover and
+mutated populations are intermediate steps of the evaluated one and
+would more than double the size of the history.
+
+The reader memory-maps the chunks, so only the generations that are
+looked at are read from the disk.
+"""
+import json
+import os
+
+import numpy as np
+
+class RunHistoryWriter:
+    """Run history writer class
+
+    Appends the evaluated population of every generation to a run history
+    directory. The chunks are memory-mapped, so a generation is copied
+    straight into the file without being buffered in memory.
+
+    A directory that already holds a run history is appended to, keeping
+    its chunk size, e.g. by an execution resumed from a checkpoint. Its
+    generations from the first appended one on are replaced, so an
+    execution that starts again from generation 1 rewrites it
+    """
+    def __init__(self, path: str, chunk_size: int = 16) -> None:
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1')
+
+        self._path = str(path)
+        self._chunk_size = chunk_size
+        self._generations = []
+        self._chunk = None
+        self._meta = None
+        self._resumed = False
+        os.makedirs(self._path, exist_ok=True)
+
+        meta_path = os.path.join(self._path, 'run.json')
+
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as file:
+                self._meta = json.load(file)
+
+            self._chunk_size = self._meta["chunk_size"]
+            self._generations = self._meta["generations"]
+            self._resumed = True
+
+    @property
+    def path(self) -> str:
+        """Get run history directory"""
+        return self._path
+
+    @property
+    def chunk_size(self) -> int:
+        """Get number of generations per chunk"""
+        return self._chunk_size
+
+    def append(self, generation: int, chromosomes: np.ndarray, fitness: np.ndarray) -> None:
+        """Appends the evaluated population of a generation"""
+        chromosomes = np.asarray(chromosomes)
+        fitness = np.asarray(fitness, dtype=np.float64)
+
+        if self._meta is None:
+            self._meta = {
+                "pop_size": chromosomes.shape[0],
+                "chromo_len": chromosomes.shape[1],
+                "dtype": chromosomes.dtype.str,
+                "chunk_size": self._chunk_size,
+                "generations": self._generations,
+            }
+        elif chromosomes.shape != (self._meta["pop_size"], self._meta["chromo_len"]):
+            raise ValueError('Every generation must have the same shape', chromosomes.shape)
+        elif chromosomes.dtype.str != self._meta["dtype"]:
+            raise ValueError('Every generation must have the same dtype', chromosomes.dtype.str)
+
+        if self._resumed:
+            # Generations written after the checkpoint the execution resumed from
+            self._generations[:] = [gen for gen in self._generations if gen < generation]
+            self._resumed = False
+
+        row = len(self._generations) % self._chunk_size
+
+        if row == 0:
+            self.flush()
+            self._chunk = self.open_chunk(len(self._generations) // self._chunk_size)
+        elif self._chunk is None:
+            self._chunk = self.open_chunk(len(self._generations) // self._chunk_size, 'r+')
+
+        chromosome_chunk, fitness_chunk = self._chunk
+        chromosome_chunk[row] = chromosomes
+        fitness_chunk[row] = fitness
+        self._generations.append(int(generation))
+
+        if row == self._chunk_size - 1:
+            self.flush()
+
+    def open_chunk(self, index: int, mode: str = 'w+') -> tuple:
+        """Creates the files of a chunk, or opens them with mode 'r+'"""
+        pop_size = self._meta["pop_size"]
+        chromosome_chunk = np.lib.format.open_memmap(
+            os.path.join(self._path, f'chromosomes-{index:05d}.npy'),
+            mode=mode,
+            dtype=np.dtype(self._meta["dtype"]),
+            shape=(self._chunk_size, pop_size, self._meta["chromo_len"])
+        )
+        fitness_chunk = np.lib.format.open_memmap(
+            os.path.join(self._path, f'fitness-{index:05d}.npy'),
+            mode=mode,
+            dtype=np.float64,
+            shape=(self._chunk_size, pop_size)
+        )
+
+        return chromosome_chunk, fitness_chunk
+
+    def flush(self) -> None:
+        """Writes the pending generations and the list of generations to the disk"""
+        if self._chunk is not None:
+            for chunk in self._chunk:
+                chunk.flush()
+
+            if len(self._generations) % self._chunk_size == 0:
+                self._chunk = None
+
+        if self._meta is not None:
+            temp_path = os.path.join(self._path, 'run.json.tmp')
+
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self._meta, file)
+
+            os.replace(temp_path, os.path.join(self._path, 'run.json'))
+
+    def close(self) -> None:
+        """Writes everything to the disk and releases the chunk files"""
+        self.flush()
+        self._chunk = None
+
+class RunHistory:
+    """Run history reader class
+
+    Reads a run history written by RunHistoryWriter. Nothing is loaded
+    until a generation is asked for, and then only that generation is
+    read from its memory-mapped chunk
+    """
+    def __init__(self, path: str) -> None:
+        self._path = str(path)
+
+        with open(os.path.join(self._path, 'run.json'), encoding='utf-8') as file:
+            self._meta = json.load(file)
+
+        self._rows = {generation: i for i, generation in enumerate(self._meta["generations"])}
+        self._chunks = {}
+
+    @property
+    def generations(self) -> list:
+        """Get generations in the run history"""
+        return list(self._meta["generations"])
+
+    @property
+    def pop_size(self) -> int:
+        """Get population size"""
+        return self._meta["pop_size"]
+
+    @property
+    def chromo_len(self) -> int:
+        """Get chromosome length"""
+        return self._meta["chromo_len"]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def chunk(self, index: int) -> tuple:
+        """Returns the memory-mapped chromosome and fitness arrays of a chunk"""
+        if index not in self._chunks:
+            self._chunks[index] = tuple(
+                np.load(os.path.join(self._path, f'{column}-{index:05d}.npy'), mmap_mode='r')
+                for column in ('chromosomes', 'fitness')
+            )
+
+        return self._chunks[index]
+
+    def locate(self, generation: int) -> tuple:
+        """Returns the chunk and the row of a generation"""
+        if generation not in self._rows:
+            raise KeyError('Generation is not in the run history', generation)
+
+        return divmod(self._rows[generation], self._meta["chunk_size"])
+
+    def chromosomes(self, generation: int) -> np.ndarray:
+        """Returns a read-only view of the chromosomes of a generation"""
+        index, row = self.locate(generation)
+        return self.chunk(index)[0][row]
+
+    def fitness(self, generation: int) -> np.ndarray:
+        """Returns a read-only view of the fitness of a generation"""
+        index, row = self.locate(generation)
+        return self.chunk(index)[1][row]
+
+    def frame(self, generation: int):
+        """Returns a pandas DataFrame of the population of a generation
+
+        The gen columns are a view of the memory-mapped chunk, only the
+        Fitness column is copied
+        """
+        from pandas import DataFrame  # pylint: disable=import-outside-toplevel
+
+        frame = DataFrame(
+            self.chromosomes(generation),
+            columns=[f'Gen {i + 1}' for i in range(self.chromo_len)],
+            copy=False
+        )
+        frame["Fitness"] = self.fitness(generation)
+
+        return frame
+
+    def frames(self, generations=None):
+        """Yields (generation, DataFrame) for the given generations, every one by default"""
+        for generation in self.generations if generations is None else generations:
+            yield generation, self.frame(generation)
+
+    def summary(self):
+        """Returns a pandas DataFrame with the best and mean fitness of every generation
+
+        Only the fitness chunks are read
+        """
+        from pandas import DataFrame  # pylint: disable=import-outside-toplevel
+
+        best_fitness = []
+        mean_fitness = []
+
+        for generation in self._meta["generations"]:
+            fitness = self.fitness(generation)
+            best_fitness.append(float(fitness.max()))
+            mean_fitness.append(float(fitness.mean()))
+
+        return DataFrame({
+            "Generation": self.generations,
+            "Best fitness": best_fitness,
+            "Mean fitness": mean_fitness,
+        })
@@ -1,17 +1,33 @@
 """This file is for defining the selection class and its child classes"""
-from random import sample
+from bisect import bisect_right
+from heapq import nlargest
+from itertools import accumulate
+from operator import itemgetter
+
+import numpy as np
 
 class Selection:
     """Selection class"""
     def __init__(self, rate: float) -> None:
         self._type = 'Selection'
         self._rate = rate
+        self._rng = np.random.default_rng()
 
     @property
     def type(self) -> str:
         """Get selection type"""
         return self._type
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Get random number generator"""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator) -> None:
+        """Set random number generator"""
+        self._rng = rng
+
     @property
     def rate(self) -> float:
         """Get selection rate"""
@@ -29,6 +45,33 @@ class Selection:
         """Selection method"""
         raise NotImplementedError('Selection method should be implemented by child class')
 
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        """Selects from a fitness vector and returns the selected indexes
+
+        Falls back to calling select() over [index, fitness] pairs
+        """
+        pop = [[i, score] for i, score in enumerate(fitness)]
+        selected_pop = self.select(pop, pop_size)
+        return np.array([i for i, _ in selected_pop], dtype=np.intp)
+
+    @staticmethod
+    def weights(fitness: np.ndarray) -> np.ndarray:
+        """Turns a fitness vector into non negative selection weights
+
+        Negative fitness is shifted so the worst individual gets weight 0.
+        If every weight is 0, every individual gets the same weight
+        """
+        weights = np.asarray(fitness, dtype=np.float64)
+        lowest = weights.min()
+
+        if lowest < 0:
+            weights = weights - lowest
+
+        if not weights.any():
+            return np.ones_like(weights)
+
+        return weights
+
 class RandomSelection(Selection):
     """Random selection class
 
@@ -39,18 +82,136 @@ class RandomSelection(Selection):
         self._type = 'random'
 
     def select(self, pop: list, pop_size: int) -> list:
-        return sample(pop, int(self._rate * pop_size))
+        indexes = self._rng.choice(len(pop), int(self._rate * pop_size), replace=False)
+        return [pop[i] for i in indexes.tolist()]
+
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        return self._rng.choice(len(fitness), int(self._rate * pop_size), replace=False)
 
 class SteadyState(Selection):
     """Steady state selection class
 
-    Sorts population by fitness score and then selects the new population
+    Selects the best individuals of the population by fitness score.
+    Only the selected individuals are ranked (partial selection), so the
+    rest of the population is never sorted
     """
     def __init__(self, rate: float) -> None:
         super().__init__(rate)
         self._type = 'steady-state'
 
     def select(self, pop: list, pop_size: int) -> list:
-        sorted_pop = sorted(pop, key=lambda x: x[1], reverse=True)
-        selected_pop = sorted_pop[:int(self._rate * pop_size)]
-        return selected_pop
+        return nlargest(int(self._rate * pop_size), pop, key=itemgetter(1))
+
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        num_selected = min(int(self._rate * pop_size), len(fitness))
+
+        if num_selected == 0:
+            return np.empty(0, dtype=np.intp)
+
+        if num_selected == len(fitness):
+            return np.arange(num_selected)
+
+        return np.argpartition(-fitness, num_selected - 1)[:num_selected]
+
+class Tournament(Selection):
+    """Tournament selection class
+
+    Every selected individual is the fittest of tournament_size
+    individuals drawn at random from the population
+    """
+    def __init__(self, rate: float) -> None:
+        super().__init__(rate)
+        self._type = 'tournament'
+        self._tournament_size = 3
+
+    @property
+    def tournament_size(self) -> int:
+        """Get number of individuals competing in every tournament"""
+        return self._tournament_size
+
+    @tournament_size.setter
+    def tournament_size(self, tournament_size: int) -> None:
+        """Set number of individuals competing in every tournament"""
+        if tournament_size >= 1:
+            self._tournament_size = tournament_size
+        else:
+            raise ValueError('Tournament size must be at least 1')
+
+    def select(self, pop: list, pop_size: int) -> list:
+        entrants = self._rng.integers(
+            0,
+            len(pop),
+            size=(int(self._rate * pop_size), self._tournament_size)
+        )
+
+        return [
+            max((pop[i] for i in tournament), key=itemgetter(1))
+            for tournament in entrants.tolist()
+        ]
+
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        num_selected = int(self._rate * pop_size)
+        entrants = self._rng.integers(0, len(fitness), size=(num_selected, self._tournament_size))
+        winners = np.argmax(fitness[entrants], axis=1)
+
+        return entrants[np.arange(num_selected), winners]
+
+class Roulette(Selection):
+    """Roulette wheel selection class
+
+    Selects individuals with a probability proportional to their fitness
+    """
+    def __init__(self, rate: float) -> None:
+        super().__init__(rate)
+        self._type = 'roulette'
+
+    def select(self, pop: list, pop_size: int) -> list:
+        indexes = self.select_batch(np.array([score for _, score in pop]), pop_size)
+        return [pop[i] for i in indexes.tolist()]
+
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        weights = self.weights(fitness)
+        return self._rng.choice(
+            len(fitness),
+            int(self._rate * pop_size),
+            p=weights / weights.sum()
+        )
+
+class StochasticUniversalSampling(Selection):
+    """Stochastic universal sampling class
+
+    Fitness proportionate selection that spins the roulette wheel once
+    with evenly spaced pointers, so the selection has minimum spread
+    """
+    def __init__(self, rate: float) -> None:
+        super().__init__(rate)
+        self._type = 'stochastic-universal-sampling'
+
+    def select(self, pop: list, pop_size: int) -> list:
+        num_selected = int(self._rate * pop_size)
+
+        if num_selected == 0:
+            return []
+
+        cumulative = list(accumulate(self.weights([score for _, score in pop]).tolist()))
+        step = cumulative[-1] / num_selected
+        start = self._rng.uniform(0, step)
+        last = len(pop) - 1
+
+        return [
+            pop[min(bisect_right(cumulative, start + i * step), last)]
+            for i in range(num_selected)
+        ]
+
+    def select_batch(self, fitness: np.ndarray, pop_size: int) -> np.ndarray:
+        num_selected = int(self._rate * pop_size)
+
+        if num_selected == 0:
+            return np.empty(0, dtype=np.intp)
+
+        cumulative = np.cumsum(self.weights(fitness))
+        step = cumulative[-1] / num_selected
+        pointers = self._rng.uniform(0, step) + step * np.arange(num_selected)
+        indexes = np.searchsorted(cumulative, pointers, side='right')
+
+        return np.minimum(indexes, len(fitness) - 1)
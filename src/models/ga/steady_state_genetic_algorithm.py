@@ -0,0 +1,256 @@
+"""This file is for defining the steady-state genetic algorithm"""
+import asyncio
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from heapq import heapify, heappop, heappush, nlargest, nsmallest
+from operator import itemgetter
+
+from src.models.ga.executor import PoolExecutor
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.profiling import Profiler
+
+class SteadyStateGeneticAlgorithm(GeneticAlgorithm):
+    """Steady-state genetic algorithm
+
+    Instead of replacing the whole population every generation, it breeds
+    batch_size children at a time from parents picked by tournaments, and
+    every evaluated child replaces the worst individual of the population
+    unless it is worse. A min-heap of (score, slot, version) finds the
+    worst individual in O(log n): the entries of replaced individuals are
+    left in the heap and skipped when they reach its top.
+
+    Several batches are evaluated at once (one per worker of a thread or
+    process executor, or concurrency // batch_size inside aexecute()) and
+    a new batch is bred as soon as any of them is scored, so the workers
+    do not wait for the slowest evaluation of a generation. A generation
+    is pop_size evaluated children.
+
+    The selection type, elitism and incremental evaluation are not used,
+    and with the fitness cache the batches are scored one at a time.
+
+    It is configured like GeneticAlgorithm, plus:
+    - batch size
+    - tournament size
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._name = 'steady-state-genetic-algorithm'
+        self._batch_size = 2
+        self._tournament_size = 2
+        self._heap = []
+        self._versions = []
+        self._keys = Counter()
+        self._indexed_pop = None
+        self._pending = {}
+
+    @property
+    def batch_size(self) -> int:
+        """Get number of children bred and evaluated together"""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int):
+        """Set number of children bred and evaluated together"""
+        if batch_size >= 1:
+            self._batch_size = batch_size
+        else:
+            raise ValueError('Batch size must be at least 1')
+
+    @property
+    def tournament_size(self) -> int:
+        """Get number of individuals competing to be a parent"""
+        return self._tournament_size
+
+    @tournament_size.setter
+    def tournament_size(self, tournament_size: int):
+        """Set number of individuals competing to be a parent"""
+        if tournament_size >= 1:
+            self._tournament_size = tournament_size
+        else:
+            raise ValueError('Tournament size must be at least 1')
+
+    @property
+    def max_pending(self) -> int:
+        """Get number of batches evaluated at once"""
+        if self.caching:
+            return 1
+
+        if self._loop is not None:
+            return max(1, self.concurrency // self.batch_size)
+
+        if isinstance(self._executor, PoolExecutor):
+            return self.workers
+
+        return 1
+
+    def engine_state(self) -> dict:
+        """Returns the batch and tournament sizes saved in checkpoints"""
+        return {"batch_size": self.batch_size, "tournament_size": self.tournament_size}
+
+    def restore_engine_state(self, state: dict) -> None:
+        """Restores the batch and tournament sizes of a checkpoint"""
+        self.batch_size = state.get("batch_size", 2)
+        self.tournament_size = state.get("tournament_size", 2)
+
+    def index_pop(self) -> None:
+        """Builds the heap index over the fitness of the current population"""
+        pop = self.current_pop
+        self._versions = [0] * len(pop)
+        self._heap = [(score, slot, 0) for slot, (_, score) in enumerate(pop)]
+        heapify(self._heap)
+        self._keys = Counter()
+
+        if self.duplicate_elimination:
+            self._keys.update(self.chromosome_key(chromo) for chromo, _ in pop)
+
+        self._indexed_pop = pop
+
+    def worst(self) -> int:
+        """Returns the slot of the worst individual of the current population"""
+        heap, versions = self._heap, self._versions
+
+        # Skips the entries of replaced individuals
+        while heap[0][2] != versions[heap[0][1]]:
+            heappop(heap)
+
+        return heap[0][1]
+
+    def replace(self, slot: int, chromo: list, score: float) -> None:
+        """Replaces the individual of a slot of the current population"""
+        pop = self.current_pop
+
+        if self.duplicate_elimination:
+            old_key = self.chromosome_key(pop[slot][0])
+            self._keys[old_key] -= 1
+
+            if not self._keys[old_key]:
+                del self._keys[old_key]
+
+            self._keys[self.chromosome_key(chromo)] += 1
+
+        pop[slot] = [chromo, score]
+        self._versions[slot] += 1
+        heappush(self._heap, (score, slot, self._versions[slot]))
+
+        # Stale entries only pile up when individuals other than the worst are replaced
+        if len(self._heap) > 2 * len(pop):
+            self.index_pop()
+
+    def insert(self, chromo: list, score: float) -> None:
+        """Replaces the worst individual by an evaluated child unless the child is worse"""
+        slot = self.worst()
+
+        if score >= self.current_pop[slot][1]:
+            self.replace(slot, chromo, score)
+
+    def tournament(self) -> list:
+        """Returns the chromosome of the fittest of tournament_size random individuals"""
+        pop = self.current_pop
+        contenders = self._rng.integers(0, len(pop), size=self.tournament_size)
+        return max((pop[i] for i in contenders.tolist()), key=itemgetter(1))[0]
+
+    def breed(self) -> list:
+        """Breeds a batch of mutated children"""
+        children = []
+
+        while len(children) < self.batch_size:
+            children.extend(
+                self._crossover.cross(self.chromo_len, self.tournament(), self.tournament())
+            )
+
+        children = self.mutate(children[:self.batch_size])
+
+        if self.duplicate_elimination:
+            self.replace_duplicates(children, self._keys)
+
+        return children
+
+    def submit(self, children: list) -> Future:
+        """Starts evaluating a batch of children, returns a future of its fitness array"""
+        if self.caching:
+            future = Future()
+            future.set_result(self.score(children))
+            return future
+
+        self._num_evaluations += len(children)
+
+        if self._loop is not None:
+            return asyncio.run_coroutine_threadsafe(self.ascore(children), self._loop)
+
+        return self._executor.submit(self._evaluation, children, self.expected_solution)
+
+    def generation(self, record: dict, snapshots: bool, profiler: Profiler):
+        """Breeds and evaluates batches of children until pop_size of them are evaluated
+
+        Batches still being evaluated at the end go on into the next
+        generation. Breeding is timed as the cross phase. Returns the
+        current population, which is updated in place
+        """
+        if self._indexed_pop is not self.current_pop:
+            self.index_pop()
+
+        if snapshots:
+            record.update(dict.fromkeys(
+                ["Selected population", "Crossover population", "Mutated population"]
+            ))
+
+        pending = self._pending
+        num_evaluated = 0
+
+        while num_evaluated < self.pop_size:
+            while len(pending) < self.max_pending:
+                children = self.breed()
+
+                if profiler is not None:
+                    profiler.lap('cross')
+
+                pending[self.submit(children)] = children
+
+                if profiler is not None:
+                    profiler.lap('evaluate')
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            # In submission order, so executions with one batch at a time are reproducible
+            for future in [future for future in pending if future in done]:
+                children = pending.pop(future)
+
+                for chromo, score in zip(children, future.result().tolist()):
+                    self.insert(chromo, score)
+
+                num_evaluated += len(children)
+
+            if profiler is not None:
+                profiler.lap('evaluate')
+
+        return self.current_pop
+
+    def iter_generations(self, snapshots: bool = False):
+        """Executes the genetic algorithm yielding one record per generation
+
+        See GeneticAlgorithm.iter_generations(). Batches still being
+        evaluated when the execution ends are cancelled
+        """
+        try:
+            yield from super().iter_generations(snapshots)
+        finally:
+            for future in self._pending:
+                future.cancel()
+
+            self._pending = {}
+
+    def immigrate(self, immigrants: list) -> None:
+        """Replaces the worst individuals of the current population
+
+        The fittest immigrants, given as [[chromosome, score], ...], take the
+        place of the same number of the worst individuals
+        """
+        if self._indexed_pop is not self.current_pop:
+            self.index_pop()
+
+        pop = self.current_pop
+        immigrants = nlargest(len(pop), immigrants, key=itemgetter(1))
+        worst = nsmallest(len(immigrants), range(len(pop)), key=lambda i: pop[i][1])
+
+        for i, (chromo, score) in zip(worst, immigrants):
+            self.replace(i, list(chromo), score)
@@ -0,0 +1,124 @@
+"""This file is for defining the stopping criterion class and its child classes"""
+from time import monotonic
+
+class StoppingCriterion:
+    """Stopping criterion class
+
+    Tells the genetic algorithm to stop before its last generation
+    """
+    def __init__(self, value) -> None:
+        self._type = 'StoppingCriterion'
+        self._value = value
+
+    @property
+    def type(self) -> str:
+        """Get stopping criterion type"""
+        return self._type
+
+    @property
+    def value(self):
+        """Get stopping criterion value"""
+        return self._value
+
+    def reset(self) -> None:
+        """Resets the criterion before an execution starts"""
+
+    def check(self, ga, record: dict) -> str:
+        """Returns the reason to stop after a generation, or None to go on"""
+        raise NotImplementedError('Check method should be implemented by child class')
+
+class TargetFitness(StoppingCriterion):
+    """Target fitness class
+
+    Stops once the best fitness reaches the value
+    """
+    def __init__(self, value: float) -> None:
+        super().__init__(value)
+        self._type = 'target-fitness'
+
+    def check(self, ga, record: dict) -> str:
+        if record["Best fitness"] >= self._value:
+            return f'{self._type}: best fitness reached {self._value}'
+
+        return None
+
+class NoImprovement(StoppingCriterion):
+    """No improvement class
+
+    Stops once the best fitness has not improved for value generations
+    """
+    def __init__(self, value: int) -> None:
+        if value < 1:
+            raise ValueError('Number of generations without improvement must be at least 1')
+
+        super().__init__(value)
+        self._type = 'no-improvement'
+        self._best_fitness = None
+        self._stagnant_generations = 0
+
+    def reset(self) -> None:
+        self._best_fitness = None
+        self._stagnant_generations = 0
+
+    def check(self, ga, record: dict) -> str:
+        if self._best_fitness is None or record["Best fitness"] > self._best_fitness:
+            self._best_fitness = record["Best fitness"]
+            self._stagnant_generations = 0
+            return None
+
+        self._stagnant_generations += 1
+
+        if self._stagnant_generations >= self._value:
+            return f'{self._type}: no improvement for {self._value} generations'
+
+        return None
+
+class LowDiversity(StoppingCriterion):
+    """Low diversity class
+
+    Stops once the diversity of the population (mean standard deviation
+    of its gens) falls below the value
+    """
+    def __init__(self, value: float) -> None:
+        super().__init__(value)
+        self._type = 'low-diversity'
+
+    def check(self, ga, record: dict) -> str:
+        if ga.diversity() < self._value:
+            return f'{self._type}: diversity fell below {self._value}'
+
+        return None
+
+class TimeBudget(StoppingCriterion):
+    """Time budget class
+
+    Stops once the execution has run for value seconds
+    """
+    def __init__(self, value: float) -> None:
+        super().__init__(value)
+        self._type = 'time-budget'
+        self._start = monotonic()
+
+    def reset(self) -> None:
+        self._start = monotonic()
+
+    def check(self, ga, record: dict) -> str:
+        if monotonic() - self._start >= self._value:
+            return f'{self._type}: ran for {self._value} seconds'
+
+        return None
+
+class EvaluationBudget(StoppingCriterion):
+    """Evaluation budget class
+
+    Stops once value chromosomes have been evaluated
+    """
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        self._type = 'evaluation-budget'
+
+    def check(self, ga, record: dict) -> str:
+        if ga.num_evaluations >= self._value:
+            return f'{self._type}: evaluated {self._value} chromosomes'
+
+        return None
@@ -0,0 +1,230 @@
+"""This file is for defining the parameter sweep of the genetic algorithm"""
+import csv
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from itertools import product
+from os import cpu_count
+
+import numpy as np
+
+def run_sweep(ga, params: dict) -> dict:
+    """Runs one configuration of a sweep inside a worker and returns its summary row"""
+    for attribute, value in params.items():
+        setattr(ga, attribute, value)
+
+    ga.history = 'none'
+    best = {"fitness": None, "generation": 0}
+
+    def track(record: dict) -> None:
+        if best["fitness"] is None or record["Best fitness"] > best["fitness"]:
+            best["fitness"] = record["Best fitness"]
+            best["generation"] = record["Generation"]
+
+    start = time.perf_counter()
+    ga.execute(on_generation=track)
+    seconds = time.perf_counter() - start
+    summary = ga.summarize(ga.current_pop)
+
+    return {
+        "Best fitness": best["fitness"],
+        "Final best fitness": summary["Best fitness"],
+        "Final mean fitness": summary["Mean fitness"],
+        "Generations to best": best["generation"],
+        "Generations run": ga.num_generations_run,
+        "Stop reason": ga.stop_reason,
+        "Evaluations": ga.num_evaluations,
+        "Seconds": seconds,
+    }
+
+class Sweep:
+    """Parameter sweep class
+
+    Runs a genetic algorithm once per combination of a parameter grid and
+    replicate, on one shared process pool. The grid maps attributes of the
+    genetic algorithm to the values to try, e.g.
+    {'selection_type': ['random', 'tournament'], 'mutation_rate': [0.1, 0.3]}
+
+    The most expensive runs (population size x chromosome length x number
+    of generations) are submitted first so the workers stay busy until
+    the end. Every run keeps no history and returns one summary row.
+
+    Configurable attributes:
+    - replicates
+    - workers
+    - seed
+    """
+    def __init__(self, ga, grid: dict) -> None:
+        for attribute, values in grid.items():
+            if not hasattr(ga, attribute):
+                raise ValueError('Grid attribute must be an attribute of the algorithm', attribute)
+
+            if not values:
+                raise ValueError('Grid attribute must have values', attribute)
+
+        self._name = 'sweep'
+        self._ga = ga
+        self._grid = {attribute: list(values) for attribute, values in grid.items()}
+        self._replicates = 1
+        self._workers = cpu_count() or 1
+        self._seed = None
+
+    @property
+    def name(self) -> str:
+        """Get algorithm name"""
+        return self._name
+
+    @property
+    def grid(self) -> dict:
+        """Get parameter grid"""
+        return self._grid
+
+    @property
+    def replicates(self) -> int:
+        """Get number of runs of every combination"""
+        return self._replicates
+
+    @replicates.setter
+    def replicates(self, replicates: int):
+        """Set number of runs of every combination"""
+        if replicates >= 1:
+            self._replicates = replicates
+        else:
+            raise ValueError('Number of replicates must be at least 1')
+
+    @property
+    def workers(self) -> int:
+        """Get number of worker processes"""
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int):
+        """Set number of worker processes"""
+        if workers >= 1:
+            self._workers = workers
+        else:
+            raise ValueError('Number of workers must be at least 1')
+
+    @property
+    def seed(self) -> int:
+        """Get seed of the runs"""
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: int):
+        """Set seed of the runs
+
+        Every run is seeded from its own independent stream of the seed,
+        None seeds every run from fresh OS entropy
+        """
+        if seed is not None and seed < 0:
+            raise ValueError('Seed must be a non negative integer or None')
+
+        self._seed = seed
+
+    def runs(self) -> list:
+        """Returns the parameters of every run, every combination once per replicate"""
+        combinations = [
+            dict(zip(self._grid, values)) for values in product(*self._grid.values())
+        ]
+        runs = []
+
+        for params in combinations:
+            for replicate in range(self._replicates):
+                runs.append({"Run": len(runs), "Replicate": replicate, **params})
+
+        # Without a seed the streams come from fresh OS entropy, so the
+        # replicates of a combination still differ from each other
+        seeds = np.random.SeedSequence(self._seed).spawn(len(runs))
+
+        for run, seed in zip(runs, seeds):
+            run["seed"] = int(seed.generate_state(1)[0])
+
+        return runs
+
+    def cost(self, params: dict) -> int:
+        """Estimates the relative cost of a run"""
+        ga = self._ga
+
+        return (
+            params.get('pop_size', ga.pop_size)
+            * params.get('chromo_len', ga.chromo_len)
+            * params.get('num_generations', ga.num_generations)
+        )
+
+    def execute(self, output: str = None) -> dict:
+        """Executes every run and returns their summary rows
+
+        The table is given as {column: values} in run order, like the
+        execution data of GeneticAlgorithm.execute(). With an output path,
+        every row is also appended to a CSV file as soon as its run ends
+        """
+        runs = self.runs()
+        rows = [None] * len(runs)
+        writer = None
+        file = None
+
+        try:
+            with ProcessPoolExecutor(max_workers=self._workers) as pool:
+                futures = {}
+
+                # Longest runs first, so no worker is left with a long run at the end
+                for run in sorted(runs, key=lambda run: -self.cost(run)):
+                    params = {
+                        attribute: value for attribute, value in run.items()
+                        if attribute not in ('Run', 'Replicate')
+                    }
+                    futures[pool.submit(run_sweep, deepcopy(self._ga), params)] = run
+
+                for future in as_completed(futures):
+                    run = futures[future]
+                    rows[run["Run"]] = {**run, **future.result()}
+
+                    if output is not None:
+                        if writer is None:
+                            # pylint: disable=consider-using-with
+                            file = open(output, 'w', newline='', encoding='utf-8')
+                            writer = csv.DictWriter(file, fieldnames=list(rows[run["Run"]]))
+                            writer.writeheader()
+
+                        writer.writerow(rows[run["Run"]])
+                        file.flush()
+        finally:
+            if file is not None:
+                file.close()
+
+        columns = list(rows[0]) if rows else []
+        return {column: [row[column] for row in rows] for column in columns}
+
+    def aggregate(self, table: dict) -> dict:
+        """Averages the summary rows of the replicates of every combination"""
+        groups = {}
+
+        for i in range(len(table.get("Run", []))):
+            key = tuple(table[attribute][i] for attribute in self._grid)
+            groups.setdefault(key, []).append(i)
+
+        measures = ["Best fitness", "Generations to best", "Evaluations", "Seconds"]
+        aggregated = {attribute: [] for attribute in self._grid}
+        aggregated["Replicates"] = []
+
+        for measure in measures:
+            aggregated[f'Mean {measure.lower()}'] = []
+
+        aggregated["Std best fitness"] = []
+
+        for key, indexes in groups.items():
+            for attribute, value in zip(self._grid, key):
+                aggregated[attribute].append(value)
+
+            aggregated["Replicates"].append(len(indexes))
+
+            for measure in measures:
+                values = [table[measure][i] for i in indexes]
+                aggregated[f'Mean {measure.lower()}'].append(float(np.mean(values)))
+
+            aggregated["Std best fitness"].append(
+                float(np.std([table["Best fitness"][i] for i in indexes]))
+            )
+
+        return aggregated
@@ -0,0 +1,189 @@
+"""This file is for defining the vectorized genetic algorithm"""
+from heapq import nlargest
+from operator import itemgetter
+
+import numpy as np
+
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.population import Population
+
+class VectorizedGeneticAlgorithm(GeneticAlgorithm):
+    """Genetic algorithm backed by numpy arrays
+
+    The population is a (pop_size, chromo_len) matrix, of the dtype of the
+    gen type, plus a fitness vector, so initialization, crossover and
+    mutation run as one batched operation per generation instead of once
+    per gen.
+
+    Two chromosome buffers are preallocated and swapped every generation:
+    crossover and mutation write the offspring straight into the buffer
+    that does not hold the current population, after the rows kept for
+    the elite.
+
+    It is configured exactly like GeneticAlgorithm.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._name = 'vectorized-genetic-algorithm'
+        self._buffers = []
+
+    def next_buffer(self) -> np.ndarray:
+        """Returns the buffer the next generation is written into"""
+        shape = (self.pop_size, self.chromo_len)
+        dtype = self._gen.dtype
+
+        if not self._buffers or self._buffers[0].shape != shape or self._buffers[0].dtype != dtype:
+            self._buffers = [np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype)]
+
+        chromosomes = getattr(self.current_pop, 'chromosomes', None)
+
+        if chromosomes is not None and np.may_share_memory(self._buffers[0], chromosomes):
+            return self._buffers[1]
+
+        return self._buffers[0]
+
+    def init_pop(self) -> Population:
+        """Initializes the population"""
+        chromosomes = self._gen.create_batch((self.pop_size, self.chromo_len))
+        self._buffers = [chromosomes, np.empty_like(chromosomes)]
+
+        evaluated_pop = self.evaluate(Population(chromosomes))
+        self.current_pop = evaluated_pop
+        return evaluated_pop
+
+    def evaluate(self, pop: Population) -> Population:
+        """Evaluates the population"""
+        parents, self._parents = self._parents, None
+
+        if parents is not None and self.incremental:
+            sel_pop, indexes = parents
+            fitness = self.delta_score(
+                pop.chromosomes,
+                sel_pop.chromosomes[indexes],
+                sel_pop.fitness[indexes]
+            )
+        else:
+            fitness = self.score(pop.chromosomes)
+
+        return Population(pop.chromosomes, fitness)
+
+    def select(self, new_pop: Population) -> Population:
+        """Selects a percentage of the new population for the next generation"""
+        indexes = self._selection.select_batch(new_pop.fitness, self.pop_size)
+        return new_pop.take(indexes)
+
+    def cross(self, sel_pop: Population) -> Population:
+        """Selects random parents according to the selected crossover"""
+        num_pairs = -(-self.num_offspring // 2)
+        pairs1 = self._rng.integers(0, len(sel_pop), size=num_pairs)
+        pairs2 = self._rng.integers(0, len(sel_pop), size=num_pairs)
+
+        offspring = self._crossover.cross_batch(
+            sel_pop.chromosomes,
+            pairs1,
+            pairs2,
+            out=self.next_buffer()[self.elitism:]
+        )
+
+        # Every child takes the place of one of its parents for the incremental evaluation
+        if self.incremental:
+            self._parents = (sel_pop, np.concatenate([pairs1, pairs2])[:len(offspring)])
+
+        return Population(offspring)
+
+    def mutate(self, offspring: Population) -> Population:
+        """Mutates the offspring population"""
+        return Population(self._mutation.mutate_batch(offspring.chromosomes, self._gen))
+
+    def elite(self, pop: Population) -> Population:
+        """Returns a copy of the elitism fittest individuals of an evaluated population"""
+        if self.elitism == 0:
+            return pop.take(slice(0, 0))
+
+        return pop.take(np.argpartition(-pop.fitness, self.elitism - 1)[:self.elitism])
+
+    def add_elite(self, pop: Population, elite: Population) -> Population:
+        """Returns the evaluated offspring population with the elite added
+
+        The offspring were bred into the buffer after its first elitism
+        rows, so only the elite is copied
+        """
+        if len(elite) == 0:
+            return pop
+
+        chromosomes = self.next_buffer()
+        chromosomes[:len(elite)] = elite.chromosomes
+
+        if not np.may_share_memory(chromosomes, pop.chromosomes):
+            chromosomes[len(elite):] = pop.chromosomes
+
+        return Population(chromosomes, np.concatenate([elite.fitness, pop.fitness]))
+
+    def chromosome_key(self, chromo: np.ndarray) -> bytes:
+        """Returns the key of a chromosome in the duplicate index"""
+        return chromo.tobytes()
+
+    def eliminate_duplicates(self, offspring: Population) -> Population:
+        """Replaces the repeated children of the offspring population"""
+        index = set(map(self.chromosome_key, self.current_pop.chromosomes))
+        self.replace_duplicates(offspring.chromosomes, index)
+        return offspring
+
+    def diversity(self) -> float:
+        """Returns the mean standard deviation of the gens of the current population"""
+        return float(self.current_pop.chromosomes.std(axis=0).mean())
+
+    def snapshot(self, pop: Population) -> Population:
+        """Returns an independent copy of a population"""
+        return pop.copy()
+
+    def best(self, num_best: int) -> list:
+        """Returns copies of the fittest individuals of the current population
+
+        I.E.
+        Output: [[chromosome, score], ...]
+        """
+        fitness = self.current_pop.fitness
+        num_best = min(num_best, len(fitness))
+
+        if num_best == 0:
+            return []
+
+        best = np.argpartition(-fitness, num_best - 1)[:num_best]
+        return self.current_pop.take(best).to_list()
+
+    def immigrate(self, immigrants: list) -> None:
+        """Replaces the worst individuals of the current population
+
+        The fittest immigrants, given as [[chromosome, score], ...], take the
+        place of the same number of the worst individuals
+        """
+        pop = self.current_pop
+        immigrants = nlargest(len(pop), immigrants, key=itemgetter(1))
+
+        if not immigrants:
+            return
+
+        worst = np.argpartition(pop.fitness, len(immigrants) - 1)[:len(immigrants)]
+        pop.chromosomes[worst] = [chromo for chromo, _ in immigrants]
+        pop.fitness[worst] = [score for _, score in immigrants]
+
+    def population_arrays(self, pop: Population) -> tuple:
+        """Returns new chromosome matrix and fitness vector arrays of a population"""
+        return pop.chromosomes.copy(), pop.fitness.copy()
+
+    def population_from_arrays(self, chromosomes: np.ndarray, fitness: np.ndarray) -> Population:
+        """Returns the population given by a chromosome matrix and a fitness vector"""
+        chromosomes = np.array(chromosomes, dtype=self._gen.dtype)
+        self._buffers = [chromosomes, np.empty_like(chromosomes)]
+        return Population(chromosomes, np.array(fitness, dtype=np.float64))
+
+    def summarize(self, pop: Population) -> dict:
+        """Summarizes the fitness of an evaluated population"""
+        best = int(np.argmax(pop.fitness))
+
+        return {
+            "Best fitness": float(pop.fitness[best]),
+            "Mean fitness": float(pop.fitness.mean()),
+            "Best chromosome": pop.chromosomes[best].tolist(),
+        }
@@ -0,0 +1,38 @@
+"""Fixtures shared by the tests"""
+import pytest
+
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+from src.models.ga.vectorized_genetic_algorithm import VectorizedGeneticAlgorithm
+
+ENGINES = [GeneticAlgorithm, VectorizedGeneticAlgorithm, SteadyStateGeneticAlgorithm]
+
+@pytest.fixture(name='ga_class', params=ENGINES, ids=lambda ga_class: ga_class.__name__)
+def fixture_ga_class(request):
+    """Every genetic algorithm engine"""
+    return request.param
+
+@pytest.fixture(name='configure')
+def fixture_configure():
+    """Returns a function creating a small seeded genetic algorithm
+
+    configure(ga_class, evaluation=None, **attributes) scores with the
+    sphere evaluation, or with the given evaluation object, and sets the
+    given attributes over the defaults
+    """
+    def configure(ga_class=GeneticAlgorithm, evaluation=None, **attributes):
+        ga = ga_class()
+        ga.seed = 0
+        ga.evaluation = 'sphere'
+        ga.history = 'summary'
+        ga.pop_size = 20
+
+        for attribute, value in attributes.items():
+            setattr(ga, attribute, value)
+
+        if evaluation is not None:
+            ga._evaluation = evaluation  # pylint: disable=protected-access
+
+        return ga
+
+    return configure
@@ -0,0 +1,99 @@
+"""Tests of the asynchronous evaluation against a local fake async server"""
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from src.models.evaluation import Sphere
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.vectorized_genetic_algorithm import VectorizedGeneticAlgorithm
+
+class FakeServer:
+    """Scores one JSON chromosome per line after a delay and counts the calls in flight"""
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.port = None
+        self._server = None
+
+    async def handle(self, reader, writer) -> None:
+        """Answers the requests of one connection"""
+        while line := await reader.readline():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(self.delay)
+            self.active -= 1
+            data = json.loads(line)
+            writer.write((json.dumps(-sum(gen * gen for gen in data)) + '\n').encode())
+            await writer.drain()
+
+        writer.close()
+
+    async def __aenter__(self) -> 'FakeServer':
+        self._server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+class RemoteSphere(Sphere):
+    """Sphere evaluation scored by the fake server"""
+    def __init__(self, port: int) -> None:
+        super().__init__()
+        self.port = port
+
+    async def ascore(self, data: list, expected_solution: str) -> list:
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write((json.dumps([float(gen) for gen in data]) + '\n').encode())
+        await writer.drain()
+        score = json.loads(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        return [data, score]
+
+def test_results_match_synchronous_execution(configure, ga_class):
+    async def run():
+        async with FakeServer(delay=0.001) as server:
+            ga = configure(ga_class, RemoteSphere(server.port), num_generations=4)
+            # The steady-state engine is only reproducible with one batch in flight
+            ga.concurrency = getattr(ga, 'batch_size', 8)
+            return await ga.aexecute()
+
+    _, exec_data = asyncio.run(run())
+    _, expected = configure(ga_class, num_generations=4).execute()
+
+    assert np.allclose(exec_data["Best fitness"], expected["Best fitness"])
+    assert np.allclose(exec_data["Mean fitness"], expected["Mean fitness"])
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_calls_in_flight_stay_within_concurrency(configure, concurrency):
+    async def run():
+        async with FakeServer(delay=0.01) as server:
+            ga = configure(GeneticAlgorithm, RemoteSphere(server.port), num_generations=4)
+            ga.concurrency = concurrency
+            await ga.aexecute()
+            return server.peak
+
+    assert asyncio.run(run()) == concurrency
+
+def test_call_timeout_raises_timeout_error(configure):
+    async def run():
+        async with FakeServer(delay=1.0) as server:
+            ga = configure(GeneticAlgorithm, RemoteSphere(server.port), num_generations=4)
+            ga.call_timeout = 0.05
+            await ga.aexecute()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+def test_aiter_generations_yields_every_generation(configure):
+    async def run():
+        async with FakeServer(delay=0.001) as server:
+            ga = configure(VectorizedGeneticAlgorithm, RemoteSphere(server.port), num_generations=4)
+            return [record["Generation"] async for record in ga.aiter_generations()]
+
+    assert asyncio.run(run()) == [1, 2, 3, 4]
@@ -0,0 +1,48 @@
+"""Tests of resuming executions from checkpoints"""
+import numpy as np
+
+from src.models.ga.steady_state_genetic_algorithm import SteadyStateGeneticAlgorithm
+
+def resumed_run(configure, ga_class, tmp_path, **attributes) -> tuple:
+    """Returns the best fitness of generations 11 to 20 of an uninterrupted
+    execution and of an execution resumed by a new object after generation 10
+    """
+    path = str(tmp_path / 'checkpoint.npz')
+
+    attributes["chromo_len"] = 6
+    _, uninterrupted = configure(ga_class, num_generations=20, **attributes).execute()
+
+    ga = configure(ga_class, num_generations=10, **attributes)
+    ga.execute()
+    ga.checkpoint(path)
+
+    resumed_ga = ga_class()
+    resumed_ga.history = 'summary'
+    resumed_ga.resume_from(path)
+    resumed_ga.num_generations = 20
+    _, resumed = resumed_ga.execute()
+
+    return uninterrupted["Best fitness"][10:], resumed["Best fitness"], resumed_ga
+
+def test_resume_matches_uninterrupted_execution(configure, ga_class, tmp_path):
+    expected, resumed, _ = resumed_run(configure, ga_class, tmp_path)
+
+    assert np.allclose(expected, resumed)
+
+def test_resume_restores_elitism_and_duplicate_elimination(configure, ga_class, tmp_path):
+    expected, resumed, ga = resumed_run(
+        configure, ga_class, tmp_path, elitism=3, duplicate_elimination=True
+    )
+
+    assert ga.elitism == 3
+    assert ga.duplicate_elimination
+    assert np.allclose(expected, resumed)
+
+def test_resume_restores_steady_state_batch_and_tournament_sizes(configure, tmp_path):
+    expected, resumed, ga = resumed_run(
+        configure, SteadyStateGeneticAlgorithm, tmp_path, batch_size=5, tournament_size=4
+    )
+
+    assert ga.batch_size == 5
+    assert ga.tournament_size == 4
+    assert np.allclose(expected, resumed)
@@ -0,0 +1,29 @@
+"""Tests of the command line interface"""
+import json
+
+import pytest
+
+from src.cli import main
+
+def test_resume_goes_on_to_the_given_generations(tmp_path, capsys):
+    checkpoint = str(tmp_path / 'run.npz')
+    main(['run', '--evaluation', 'sphere', '--generations', '5', '--seed', '1',
+          '--output', checkpoint])
+    capsys.readouterr()
+
+    main(['run', '--resume', checkpoint, '--generations', '8', '--format', 'json'])
+    result = json.loads(capsys.readouterr().out)["result"]
+
+    assert result["Generations run"] == 8
+
+@pytest.mark.parametrize('argument', [['--pop-size', '50'], ['--crossover', 'two-point'],
+                                      ['--seed', '2'], ['--duplicate-elimination']])
+def test_resume_rejects_arguments_set_by_the_checkpoint(tmp_path, capsys, argument):
+    checkpoint = str(tmp_path / 'run.npz')
+    main(['run', '--evaluation', 'sphere', '--generations', '5', '--output', checkpoint])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['run', '--resume', checkpoint, *argument])
+
+    assert exit_info.value.code == 2
+    assert argument[0] in capsys.readouterr().err
@@ -0,0 +1,90 @@
+"""Tests of the distributed evaluation executor with local worker processes"""
+import os
+
+import numpy as np
+import pytest
+
+from src.models.evaluation import Sphere
+from src.models.ga.distributed import DistributedExecutor, TaskQueue
+
+class KillingSphere(Sphere):
+    """Sphere evaluation that kills the worker scoring it while a marker file is missing
+
+    With always_kill, every worker that scores it is killed
+    """
+    def __init__(self, marker: str, always_kill: bool = False) -> None:
+        super().__init__()
+        self.marker = marker
+        self.always_kill = always_kill
+
+    def score_batch(self, matrix, expected_solution: str) -> np.ndarray:
+        if self.always_kill or not os.path.exists(self.marker):
+            with open(self.marker, 'w', encoding='utf-8'):
+                pass
+
+            os._exit(1)
+
+        return super().score_batch(matrix, expected_solution)
+
+@pytest.fixture(name='executor')
+def fixture_executor():
+    """Distributed executor with two local workers and short timeouts"""
+    executor = DistributedExecutor(workers=2, chunk_size=4)
+    executor.task_timeout = 1.0
+    executor.max_retries = 2
+    yield executor
+    executor.shutdown()
+
+def test_scores_match_serial_evaluation(executor):
+    pop = np.random.default_rng(0).uniform(-10, 10, size=(50, 5))
+
+    scores = executor.score(Sphere(), pop, 'origin')
+
+    assert np.allclose(scores, Sphere().score_batch(pop, 'origin'))
+
+def test_killed_worker_task_is_retried(executor, tmp_path):
+    pop = np.random.default_rng(0).uniform(-10, 10, size=(4, 5))
+    evaluation = KillingSphere(str(tmp_path / 'killed'))
+
+    scores = executor.score(evaluation, pop, 'origin')
+
+    assert os.path.exists(evaluation.marker)
+    assert np.allclose(scores, Sphere().score_batch(pop, 'origin'))
+
+def test_lost_task_raises_after_max_retries(executor, tmp_path):
+    executor.local_workers = 3
+    executor.max_retries = 1
+    pop = np.random.default_rng(0).uniform(-10, 10, size=(4, 5))
+    evaluation = KillingSphere(str(tmp_path / 'killed'), always_kill=True)
+
+    with pytest.raises(RuntimeError, match='lost'):
+        executor.score(evaluation, pop, 'origin')
+
+def test_discard_takes_back_queued_tasks():
+    tasks = TaskQueue()
+    tasks.put((1, b''))
+    tasks.put((2, b''))
+    tasks.put(None)
+
+    assert tasks.discard([1, 3]) == 1
+    assert [tasks.get(), tasks.get()] == [(2, b''), None]
+
+def test_coordinator_is_kept_across_executions(configure):
+    ga = configure(history='none', num_generations=3, executor_type='distributed', workers=2)
+
+    try:
+        ga.execute()
+        address = ga.executor.address
+        processes = list(ga.executor._processes)  # pylint: disable=protected-access
+        ga.execute()
+
+        assert ga.executor.address == address
+        assert all(process.is_alive() for process in processes)
+    finally:
+        ga.executor.shutdown()
+
+    serial = configure(history='none', num_generations=3)
+    serial.execute()
+    serial.execute()
+
+    assert ga.summarize(ga.current_pop) == serial.summarize(serial.current_pop)
@@ -0,0 +1,45 @@
+"""Tests of the fitness cache"""
+import numpy as np
+
+from src.models.evaluation import Evaluation, Sphere
+from src.models.ga.fitness_cache import FitnessCache
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+
+def sphere(pop) -> np.ndarray:
+    """Scores every chromosome with the sphere function"""
+    return -np.square(np.asarray(pop, dtype=np.float64)).sum(axis=1)
+
+def test_same_bytes_of_another_gen_type_are_not_shared():
+    cache = FitnessCache(100)
+    integers = np.array([[256]], dtype=np.int16)
+    binaries = np.array([[False, True]])
+
+    assert integers.tobytes() == binaries.tobytes()
+    assert cache.score(integers, 'sphere', sphere).tolist() == [-65536.0]
+    assert cache.score(binaries, 'sphere', sphere).tolist() == [-1.0]
+    assert cache.misses == 2
+
+def test_repeated_chromosomes_are_scored_once():
+    cache = FitnessCache(100)
+    pop = np.array([[1.0, 2.0], [1.0, 2.0], [3.0, 0.0]])
+
+    assert cache.score(pop, 'sphere', sphere).tolist() == [-5.0, -5.0, -9.0]
+    assert cache.score(pop, 'sphere', sphere).tolist() == [-5.0, -5.0, -9.0]
+    assert (cache.hits, cache.misses) == (4, 2)
+
+class NoisySphere(Sphere):
+    """Sphere evaluation declared not deterministic"""
+    def __init__(self) -> None:
+        super().__init__()
+        self.deterministic = False
+
+def test_evaluations_that_are_not_deterministic_are_not_cached():
+    ga = GeneticAlgorithm()
+    ga.evaluation = 'sphere'
+    ga.fitness_cache = True
+    ga._evaluation = NoisySphere()  # pylint: disable=protected-access
+    ga.num_generations = 3
+    ga.execute()
+
+    assert not Evaluation(deterministic=False).deterministic
+    assert (ga.cache_hits, ga.cache_misses) == (0, 0)
@@ -0,0 +1,29 @@
+"""Tests of the island model"""
+from src.models.ga.island import IslandModel
+
+def small_model(ga, num_islands: int = 3) -> IslandModel:
+    """Returns an island model of copies of a genetic algorithm without migration"""
+    model = IslandModel.from_algorithm(ga, num_islands)
+    model.migration_interval = ga.num_generations
+    return model
+
+def best_fitness(exec_data: dict, num_islands: int) -> list:
+    """Returns the best fitness reached by every island"""
+    return [
+        max(fitness for island, fitness in zip(exec_data["Island"], exec_data["Best fitness"])
+            if island == index)
+        for index in range(num_islands)
+    ]
+
+def test_unseeded_islands_run_different_searches(configure):
+    _, exec_data = small_model(configure(num_generations=5)).execute()
+
+    assert len(set(best_fitness(exec_data, 3))) == 3
+
+def test_seeded_islands_are_reproducible(configure):
+    first = small_model(configure(num_generations=5))
+    first.seed = 1
+    second = small_model(configure(num_generations=5))
+    second.seed = 1
+
+    assert first.execute()[1]["Best fitness"] == second.execute()[1]["Best fitness"]
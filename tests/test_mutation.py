@@ -0,0 +1,38 @@
+"""Tests of the mutation operators"""
+import numpy as np
+
+from src.models.ga.gen import RealNumber
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.mutation import Gaussian, Mutation
+
+class ResetToZero(Mutation):
+    """Mutation written against create_gen() only"""
+    def __init__(self, rate: float):
+        super().__init__(rate)
+        self._type = 'reset-to-zero'
+
+    def mutate(self, offspring: list, chromo_len: int, create_gen) -> list:
+        for chromo in offspring:
+            chromo[0] = create_gen() * 0
+
+        return offspring
+
+def test_mutation_using_create_gen_still_works():
+    ga = GeneticAlgorithm()
+    ga._mutation = ResetToZero(1.0)  # pylint: disable=protected-access
+
+    offspring = ga.mutate([[1.0, 2.0], [3.0, 4.0]])
+
+    assert [chromo[0] for chromo in offspring] == [0.0, 0.0]
+
+def test_gaussian_keeps_list_gens_within_the_gen_range():
+    gen = RealNumber()
+    gen.min_value, gen.max_value = -1.0, 1.0
+    mutation = Gaussian(1.0)
+    mutation.sigma = 100.0
+    mutation.rng = np.random.default_rng(0)
+    mutation.gen = gen
+
+    offspring = mutation.mutate([[0.0] * 10 for _ in range(10)], 10, gen.create)
+
+    assert all(-1.0 <= value <= 1.0 for chromo in offspring for value in chromo)
@@ -0,0 +1,47 @@
+"""Tests of the on-disk run history"""
+import numpy as np
+import pytest
+
+from src.models.ga.genetic_algorithm import GeneticAlgorithm
+from src.models.ga.run_history import RunHistory, RunHistoryWriter
+
+def test_resumed_execution_appends_to_the_run_history(configure, tmp_path):
+    history_path = str(tmp_path / 'history')
+    checkpoint_path = str(tmp_path / 'checkpoint.npz')
+
+    ga = configure(history='none', num_generations=20, history_path=history_path)
+    ga.execute()
+    ga.checkpoint(checkpoint_path)
+
+    resumed_ga = GeneticAlgorithm()
+    resumed_ga.history = 'none'
+    resumed_ga.resume_from(checkpoint_path)
+    resumed_ga.num_generations = 25
+    resumed_ga.history_path = history_path
+    resumed_ga.execute()
+
+    uninterrupted_path = str(tmp_path / 'uninterrupted')
+    configure(history='none', num_generations=25, history_path=uninterrupted_path).execute()
+    history, expected = RunHistory(history_path), RunHistory(uninterrupted_path)
+
+    assert history.generations == list(range(1, 26))
+    assert np.array_equal(history.chromosomes(18), expected.chromosomes(18))
+    assert np.array_equal(history.fitness(25), expected.fitness(25))
+
+def test_new_execution_rewrites_the_run_history(configure, tmp_path):
+    history_path = str(tmp_path / 'history')
+    configure(history='none', num_generations=20, history_path=history_path).execute()
+    configure(history='none', num_generations=5, history_path=history_path).execute()
+
+    assert RunHistory(history_path).generations == [1, 2, 3, 4, 5]
+
+def test_appending_another_shape_raises(tmp_path):
+    writer = RunHistoryWriter(tmp_path)
+    writer.append(1, np.zeros((4, 3)), np.zeros(4))
+    writer.close()
+
+    with pytest.raises(ValueError):
+        RunHistoryWriter(tmp_path).append(2, np.zeros((4, 5)), np.zeros(4))
+
+    with pytest.raises(ValueError):
+        RunHistoryWriter(tmp_path).append(2, np.zeros((4, 3), dtype=np.int64), np.zeros(4))
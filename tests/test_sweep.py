@@ -0,0 +1,25 @@
+"""Tests of the parameter sweep"""
+from src.models.ga.sweep import Sweep
+
+def small_sweep(ga, seed=None) -> Sweep:
+    """Returns a sweep of two mutation rates with three replicates each"""
+    sweep = Sweep(ga, {'mutation_rate': [0.1, 0.3]})
+    sweep.replicates = 3
+    sweep.workers = 2
+    sweep.seed = seed
+    return sweep
+
+def test_unseeded_replicates_differ(configure):
+    sweep = small_sweep(configure(num_generations=5))
+    table = sweep.execute()
+
+    assert all(seed is not None for seed in table["seed"])
+    assert len(set(table["seed"])) == len(table["seed"])
+    assert all(std > 0 for std in sweep.aggregate(table)["Std best fitness"])
+
+def test_seeded_sweep_is_reproducible(configure):
+    first = small_sweep(configure(num_generations=5), seed=1).execute()
+    second = small_sweep(configure(num_generations=5), seed=1).execute()
+
+    assert first["seed"] == second["seed"]
+    assert first["Best fitness"] == second["Best fitness"]